@@ -0,0 +1,33 @@
+"""
+ciphers
+
+Caesar and Vigenere ciphers as an importable library. Importing any module
+in this package has no side effects, the interactive prompts only run when
+a script is executed directly.
+
+The original assignment scripts are kept as they were written:
+    ceasCiph_en.encrypt, ceasCipher_de.decrypt, ceasCipher_brute.brute_force_decrypt,
+    vigCipher_encrypt.vigenere_encrypt, vigCipher_decrypt.decrypt
+
+The names exported here are the fast versions of the same algorithms.
+Run "python3 -m ciphers --help" for the command line interface.
+"""
+
+from .caesar_crack import crack as crack_caesar, crack_many as crack_caesar_many, rank_shifts
+from .caesar_tables import (
+    decrypt as caesar_decrypt,
+    decrypt_many as caesar_decrypt_many,
+    encrypt as caesar_encrypt,
+    encrypt_many as caesar_encrypt_many,
+)
+from .vigenere_stream import VigenereStream
+
+
+def vigenere_encrypt(plaintext, key):
+    """Same result as vigCipher_encrypt.vigenere_encrypt."""
+    return VigenereStream(key).process(plaintext)
+
+
+def vigenere_decrypt(ciphertext, key):
+    """Same result as vigCipher_decrypt.decrypt."""
+    return VigenereStream(key, decrypt=True).process(ciphertext)
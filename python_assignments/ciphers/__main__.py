@@ -0,0 +1,94 @@
+"""
+Command line interface for the ciphers package.
+
+Usage (from the python_assignments folder):
+    python3 -m ciphers caesar-encrypt 3 "hello world"
+    python3 -m ciphers caesar-crack < message.txt
+    python3 -m ciphers vigenere-decrypt lemon "pphmpz wh pnlj"
+    python3 -m ciphers stream encrypt lemon big_file.txt -o big_file.enc
+    python3 -m ciphers bulk caesar-encrypt 3 messages.txt
+
+When no message is given it is read from stdin.
+"""
+
+import argparse
+import sys
+
+from . import bulk_cipher, caesar_crack, caesar_tables, vigenere_stream
+
+
+def _message(args):
+    return args.message if args.message is not None else sys.stdin.read().rstrip("\n")
+
+
+def _caesar_encrypt(args):
+    print(caesar_tables.encrypt(_message(args), args.shift))
+
+
+def _caesar_decrypt(args):
+    print(caesar_tables.decrypt(_message(args), args.shift))
+
+
+def _caesar_crack(args):
+    message = _message(args)
+    for place, (shift, score) in enumerate(caesar_crack.rank_shifts(message, args.top), start=1):
+        print(f"{place}. Shift {shift} (score {score:.1f}): {caesar_tables.decrypt(message, shift)}")
+
+
+def _vigenere_encrypt(args):
+    print(vigenere_stream.VigenereStream(args.key).process(_message(args)))
+
+
+def _vigenere_decrypt(args):
+    print(vigenere_stream.VigenereStream(args.key, decrypt=True).process(_message(args)))
+
+
+def _vigenere_crack(args):
+    # NumPy is only needed for cryptanalysis, so it is imported on demand
+    from . import vigenere_crack
+
+    key, plaintext = vigenere_crack.crack(_message(args), args.max_key_length)
+    print(f"Most likely key: {key}")
+    print(plaintext)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # The streaming and bulk tools have their own argument parsers
+    if argv and argv[0] == "stream":
+        return vigenere_stream.main(argv[1:])
+    if argv and argv[0] == "bulk":
+        return bulk_cipher.main(argv[1:])
+
+    parser = argparse.ArgumentParser(prog="python3 -m ciphers", description="Caesar and Vigenere ciphers.")
+    commands = parser.add_subparsers(dest="command", required=True,
+                                     help="stream and bulk are also available, see their --help")
+
+    for name, handler in [("caesar-encrypt", _caesar_encrypt), ("caesar-decrypt", _caesar_decrypt)]:
+        sub = commands.add_parser(name)
+        sub.add_argument("shift", type=int)
+        sub.add_argument("message", nargs="?")
+        sub.set_defaults(handler=handler)
+
+    sub = commands.add_parser("caesar-crack")
+    sub.add_argument("message", nargs="?")
+    sub.add_argument("--top", type=int, default=3)
+    sub.set_defaults(handler=_caesar_crack)
+
+    for name, handler in [("vigenere-encrypt", _vigenere_encrypt), ("vigenere-decrypt", _vigenere_decrypt)]:
+        sub = commands.add_parser(name)
+        sub.add_argument("key")
+        sub.add_argument("message", nargs="?")
+        sub.set_defaults(handler=handler)
+
+    sub = commands.add_parser("vigenere-crack")
+    sub.add_argument("message", nargs="?")
+    sub.add_argument("--max-key-length", type=int, default=20)
+    sub.set_defaults(handler=_vigenere_crack)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+ciphers/bulk_cipher.py
+
+Runs a cipher over many messages in parallel.
+
+Messages come from a newline delimited file (one message per line) or a
+directory (one message per file, in file name order). They are split into
+batches and spread over a ProcessPoolExecutor. Results are written in the
+same order as the input, and the records/sec rate is printed to stderr.
+With --numpy each Vigenere batch is processed in one go by vigenere_numpy.
+
+Usage:
+    python3 -m ciphers bulk caesar-encrypt 3 messages.txt -o encrypted.txt
+    python3 -m ciphers bulk vigenere-decrypt lemon exports/ --workers 8 --numpy
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from . import caesar_tables
+from .vigenere_stream import VigenereStream
+
+BATCH_SIZE = 1000
+
+
+def caesar_encrypt(messages, key):
+    return caesar_tables.encrypt_many(messages, int(key))
+
+
+def caesar_decrypt(messages, key):
+    return caesar_tables.decrypt_many(messages, int(key))
+
+
+def vigenere_encrypt(messages, key):
+    # Every message starts at the beginning of the key
+    return [VigenereStream(key).process(message) for message in messages]
+
+
+def vigenere_decrypt(messages, key):
+    return [VigenereStream(key, decrypt=True).process(message) for message in messages]
+
+
+def vigenere_numpy_encrypt(messages, key):
+    # NumPy is optional for the rest of the package, so it is imported on demand
+    from . import vigenere_numpy
+
+    return vigenere_numpy.encrypt_many(messages, key)
+
+
+def vigenere_numpy_decrypt(messages, key):
+    from . import vigenere_numpy
+
+    return vigenere_numpy.decrypt_many(messages, key)
+
+
+CIPHERS = {
+    "caesar-encrypt": caesar_encrypt,
+    "caesar-decrypt": caesar_decrypt,
+    "vigenere-encrypt": vigenere_encrypt,
+    "vigenere-decrypt": vigenere_decrypt,
+}
+# Replacements used with numpy=True, Caesar batches are already one str.translate per record
+NUMPY_CIPHERS = {
+    "vigenere-encrypt": vigenere_numpy_encrypt,
+    "vigenere-decrypt": vigenere_numpy_decrypt,
+}
+
+
+def read_messages(path):
+    """Messages from a directory (one per file) or a file (one per line)."""
+    if os.path.isdir(path):
+        messages = []
+        for name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, name)
+            if os.path.isfile(file_path):
+                with open(file_path, "r") as f:
+                    messages.append(f.read().rstrip("\n"))
+        return messages
+    with open(path, "r") as f:
+        # Iterating the file only ends a line at a newline, str.splitlines would also split
+        # messages at form feeds, \x1c-\x1e, \x85 and the Unicode line separators
+        return [line[:-1] if line.endswith("\n") else line for line in f]
+
+
+def batched(messages, batch_size):
+    for start in range(0, len(messages), batch_size):
+        yield messages[start:start + batch_size]
+
+
+def run(cipher, key, messages, workers=None, batch_size=BATCH_SIZE, numpy=False):
+    """Applies a cipher from CIPHERS to every message, keeping the input order."""
+    work = partial((numpy and NUMPY_CIPHERS.get(cipher)) or CIPHERS[cipher], key=key)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # executor.map yields batches in submission order even when they finish out of order
+        for batch in executor.map(work, batched(messages, batch_size)):
+            results.extend(batch)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt many messages across all CPU cores.")
+    parser.add_argument("cipher", choices=sorted(CIPHERS))
+    parser.add_argument("key", help="shift value for caesar, key word for vigenere")
+    parser.add_argument("input", help="newline delimited file or directory of message files")
+    parser.add_argument("-o", "--output", help="file to write, defaults to stdout")
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the number of CPUs")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--numpy", action="store_true", help="process Vigenere batches with NumPy")
+    args = parser.parse_args(argv)
+
+    messages = read_messages(args.input)
+    start = time.perf_counter()
+    results = run(args.cipher, args.key, messages, args.workers, args.batch_size, args.numpy)
+    elapsed = time.perf_counter() - start
+
+    dst = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for result in results:
+            dst.write(result + "\n")
+    finally:
+        if args.output:
+            dst.close()
+
+    rate = len(results) / elapsed if elapsed > 0 else float("inf")
+    print(f"Processed {len(results)} records in {elapsed:.2f}s ({rate:,.0f} records/sec)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+ciphers/caesar_crack.py
+
+Statistical Caesar cipher cracker.
+
+Instead of printing all 26 decryptions like ceasCipher_brute.py, this counts
+the letters of the ciphertext once and scores every shift with a chi-squared
+test against English letter frequencies. Scoring a shift only rotates the
+26 letter histogram, so ranking all shifts costs O(n + 26^2) and only the
+winning shift is ever decrypted.
+
+The returned shift is the one the message was encrypted with, so
+caesar_tables.decrypt(ciphertext, shift) gives the plaintext. The
+decrypt(message, offset) function in ceasCipher_brute.py needs an offset
+of 26 - shift for the same result.
+
+Usage (from the python_assignments folder):
+    python3 -m ciphers caesar-crack < message.txt
+"""
+
+from collections import Counter
+
+from . import caesar_tables
+
+# Relative frequency of each letter a-z in English text
+ENGLISH_FREQUENCIES = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015,
+    0.06094, 0.06966, 0.00153, 0.00772, 0.04025, 0.02406, 0.06749,
+    0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056, 0.02758,
+    0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+
+
+def letter_histogram(text):
+    """Counts of each letter a-z in text, ignoring case."""
+    counts = Counter(text.lower())
+    return [counts[letter] for letter in caesar_tables.LOWER]
+
+
+def score_shifts(histogram):
+    """Chi-squared score of every shift 0-25 for a letter histogram, lower is better."""
+    total = sum(histogram)
+    if total == 0:
+        return [0.0] * 26
+    expected = [total * f for f in ENGLISH_FREQUENCIES]
+    scores = []
+    for shift in range(26):
+        # Undoing the shift maps ciphertext letter (i + shift) back to plaintext letter i
+        score = 0.0
+        for i in range(26):
+            diff = histogram[(i + shift) % 26] - expected[i]
+            score += diff * diff / expected[i]
+        scores.append(score)
+    return scores
+
+
+def rank_shifts(ciphertext, top=3):
+    """Returns the top most likely (shift, score) pairs, best first."""
+    scores = score_shifts(letter_histogram(ciphertext))
+    ranked = sorted(range(26), key=scores.__getitem__)
+    return [(shift, scores[shift]) for shift in ranked[:top]]
+
+
+def crack(ciphertext):
+    """Returns the most likely (shift, plaintext) for one ciphertext."""
+    shift = rank_shifts(ciphertext, top=1)[0][0]
+    return shift, caesar_tables.decrypt(ciphertext, shift)
+
+
+def crack_many(ciphertexts):
+    """Cracks a batch of independent ciphertexts, returns a list of (shift, plaintext)."""
+    return [crack(ciphertext) for ciphertext in ciphertexts]
@@ -0,0 +1,82 @@
+"""
+ciphers/caesar_tables.py
+
+Table driven Caesar cipher for bulk use.
+
+The translation tables for all 26 shifts are built once at import, so
+encrypting or decrypting a message is a single str.translate (or
+bytes.translate) call instead of an alphabet.index lookup and a string
+concatenation per character.
+
+- Upper and lower case letters are shifted and keep their case
+- Every other character passes through unchanged
+- encrypt_many / decrypt_many apply one shift to a whole batch of records;
+  str batches are joined and translated in one call
+"""
+
+import string
+from itertools import accumulate
+
+LOWER = string.ascii_lowercase
+UPPER = string.ascii_uppercase
+
+
+def _shifted(alphabet, shift):
+    return alphabet[shift:] + alphabet[:shift]
+
+
+def _build_tables(shift):
+    # One table for str input and one for bytes input, both covering a-z and A-Z
+    source = LOWER + UPPER
+    target = _shifted(LOWER, shift) + _shifted(UPPER, shift)
+    return str.maketrans(source, target), bytes.maketrans(source.encode(), target.encode())
+
+
+# Tables indexed by shift value, ENCRYPT_TABLES[n] moves every letter n places forward
+ENCRYPT_TABLES, ENCRYPT_BYTE_TABLES = zip(*(_build_tables(n) for n in range(26)))
+# Decrypting with shift n is the same as encrypting with shift 26 - n
+DECRYPT_TABLES = tuple(ENCRYPT_TABLES[-n % 26] for n in range(26))
+DECRYPT_BYTE_TABLES = tuple(ENCRYPT_BYTE_TABLES[-n % 26] for n in range(26))
+
+
+def _pick(tables, byte_tables, text, shift):
+    if isinstance(text, (bytes, bytearray)):
+        return byte_tables[shift % 26]
+    return tables[shift % 26]
+
+
+def encrypt(text, shift):
+    """Shifts every letter of text (str or bytes) forward by shift places."""
+    return text.translate(_pick(ENCRYPT_TABLES, ENCRYPT_BYTE_TABLES, text, shift))
+
+
+def decrypt(text, shift):
+    """Reverses encrypt(text, shift)."""
+    return text.translate(_pick(DECRYPT_TABLES, DECRYPT_BYTE_TABLES, text, shift))
+
+
+def _translate_many(tables, byte_tables, texts, shift):
+    table = tables[shift % 26]
+    byte_table = byte_tables[shift % 26]
+    texts = list(texts)
+    # str.translate has a high cost per call, so a batch of str records is joined,
+    # translated once and sliced apart. bytes.translate is cheap enough per record
+    if all(type(text) is str for text in texts):
+        return _split(''.join(texts).translate(table), texts)
+    return [text.translate(byte_table if isinstance(text, (bytes, bytearray)) else table) for text in texts]
+
+
+def _split(joined, texts):
+    # Cuts joined back into pieces the same lengths as texts
+    ends = list(accumulate(map(len, texts), initial=0))
+    return [joined[start:end] for start, end in zip(ends, ends[1:])]
+
+
+def encrypt_many(texts, shift):
+    """Encrypts every record in texts with the same shift and returns a list."""
+    return _translate_many(ENCRYPT_TABLES, ENCRYPT_BYTE_TABLES, texts, shift)
+
+
+def decrypt_many(texts, shift):
+    """Decrypts every record in texts with the same shift and returns a list."""
+    return _translate_many(DECRYPT_TABLES, DECRYPT_BYTE_TABLES, texts, shift)
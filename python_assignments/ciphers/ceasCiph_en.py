@@ -18,7 +18,8 @@ def encrypt(text, shift):
 
     return "".join(encrypted_text)
 
-text = input("Enter text to encrypt: ")
-shift = int(input("Enter the shift value: "))
-encrypted = encrypt(text, shift)
-print(f"Encrypted message is: {encrypted}")
+if __name__ == "__main__":
+    text = input("Enter text to encrypt: ")
+    shift = int(input("Enter the shift value: "))
+    encrypted = encrypt(text, shift)
+    print(f"Encrypted message is: {encrypted}")
@@ -1,8 +1,3 @@
-# Ask the user for the encrypted message
-message = input("Enter encrypted message to decrypt: ")
-# Ask user for the shift value
-offset = int(input("Enter the shift value: "))
-
 # Function for decryption
 def decrypt(message, offset):
     # Stores the letters of the alphabet
@@ -22,18 +17,24 @@ def decrypt(message, offset):
     # Returns the deciphered message
     return cipher
 
-# Calls the decrypt function with variables message and shift as arguments and stores the output to the variable decrypted
-decrypted = decrypt(message, offset)        
+def brute_force_decrypt(message):
+    #when the shift is unknown, returns (shift, decrypted message) for every shift
+    return [(n, decrypt(message, n)) for n in range(26)]
 
-# Prints decrypted message 
-print(f"Decrypted message is: {decrypted}")
+if __name__ == "__main__":
+    # Ask the user for the encrypted message
+    message = input("Enter encrypted message to decrypt: ")
+    # Ask user for the shift value
+    offset = int(input("Enter the shift value: "))
 
-def brute_force_decrypt(message):
-    #when the shift is unknown
-    for n in range(26):
+    # Calls the decrypt function with variables message and shift as arguments and stores the output to the variable decrypted
+    decrypted = decrypt(message, offset)
+
+    # Prints decrypted message
+    print(f"Decrypted message is: {decrypted}")
+
+    brute = input("Enter encrypted message to brute force: ")
+    for n, decrypted in brute_force_decrypt(brute):
         print(f"Using a shift value of {n}")
-        print(decrypt(message, n))
+        print(decrypted)
         print("\n***\n")
-
-brute = input("Enter encrypted message to brute force: ") 
-brute = brute_force_decrypt(brute)
\ No newline at end of file
@@ -1,8 +1,3 @@
-# Ask the user for the encrypted message
-message = input("Enter encrypted message to decrypt: ")
-# Ask user for the shift value
-offset = int(input("Enter the shift value: "))
-
 # Function for decryption
 def decrypt(message, shift):
     # Stores the letters of the alphabet
@@ -15,15 +10,21 @@ def decrypt(message, shift):
         # checks if each character of the encrypted message matches a character in letters  
         if i in letters:
             # Deciphers each character of the encrypted message and adds each deciphered character to the cipher variable
-            cipher += letters[(letters.index(i) + offset)%(len(letters))]
+            cipher += letters[(letters.index(i) + shift)%(len(letters))]
         # Adds characters in the encrypted message that are not characters in the letters variable 
         else:
              cipher += i
     # Returns the deciphered message
     return cipher
 
-# Calls the decrypt function with variables message and shift as arguments and stores the output to the variable decrypted
-decrypted = decrypt(message, offset)        
+if __name__ == "__main__":
+    # Ask the user for the encrypted message
+    message = input("Enter encrypted message to decrypt: ")
+    # Ask user for the shift value
+    offset = int(input("Enter the shift value: "))
+
+    # Calls the decrypt function with variables message and shift as arguments and stores the output to the variable decrypted
+    decrypted = decrypt(message, offset)
 
-# Prints decrypted message 
-print(f"Decrypted message is: {decrypted}")
+    # Prints decrypted message
+    print(f"Decrypted message is: {decrypted}")
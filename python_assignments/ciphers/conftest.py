@@ -0,0 +1,17 @@
+"""
+ciphers/conftest.py
+
+Benchmarks take about half a minute, so a plain pytest run skips them.
+Run them with --benchmark-only (needs pytest-benchmark).
+"""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", False):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
@@ -0,0 +1,96 @@
+"""
+Benchmarks for the five cipher algorithms across input sizes.
+
+Each algorithm is timed in its original assignment form and in its fast
+library form, so the two can be compared in one report. They are skipped in
+a plain test run (see conftest.py), run them with:
+
+    python3 -m pytest ciphers/test_benchmarks.py --benchmark-only --benchmark-group-by=param:size
+"""
+
+import random
+import string
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from . import caesar_crack, caesar_tables, vigenere_numpy, vigenere_stream
+from .ceasCiph_en import encrypt
+from .ceasCipher_brute import brute_force_decrypt
+from .ceasCipher_de import decrypt
+from .vigCipher_decrypt import decrypt as vigenere_decrypt
+from .vigCipher_encrypt import vigenere_encrypt
+
+SIZES = [100, 10_000, 100_000]
+KEY = "lemon"
+
+
+def make_message(size):
+    rng = random.Random(size)
+    return "".join(rng.choice(string.ascii_lowercase + "  ,.") for _ in range(size))
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"size={size}")
+def message(request):
+    return make_message(request.param)
+
+
+def test_caesar_encrypt(benchmark, message):
+    benchmark.group = "caesar encrypt"
+    benchmark(encrypt, message, 3)
+
+
+def test_caesar_encrypt_tables(benchmark, message):
+    benchmark.group = "caesar encrypt"
+    benchmark(caesar_tables.encrypt, message, 3)
+
+
+def test_caesar_decrypt(benchmark, message):
+    benchmark.group = "caesar decrypt"
+    benchmark(decrypt, message, 23)
+
+
+def test_caesar_decrypt_tables(benchmark, message):
+    benchmark.group = "caesar decrypt"
+    benchmark(caesar_tables.decrypt, message, 3)
+
+
+def test_caesar_brute_force(benchmark, message):
+    benchmark.group = "caesar brute force"
+    benchmark(brute_force_decrypt, message)
+
+
+def test_caesar_crack(benchmark, message):
+    benchmark.group = "caesar brute force"
+    benchmark(caesar_crack.crack, message)
+
+
+def test_vigenere_encrypt(benchmark, message):
+    benchmark.group = "vigenere encrypt"
+    benchmark(vigenere_encrypt, message, KEY)
+
+
+def test_vigenere_encrypt_stream(benchmark, message):
+    benchmark.group = "vigenere encrypt"
+    benchmark(lambda: vigenere_stream.VigenereStream(KEY).process(message))
+
+
+def test_vigenere_encrypt_numpy(benchmark, message):
+    benchmark.group = "vigenere encrypt"
+    benchmark(vigenere_numpy.encrypt, message, KEY)
+
+
+def test_vigenere_decrypt(benchmark, message):
+    benchmark.group = "vigenere decrypt"
+    benchmark(vigenere_decrypt, message, KEY)
+
+
+def test_vigenere_decrypt_stream(benchmark, message):
+    benchmark.group = "vigenere decrypt"
+    benchmark(lambda: vigenere_stream.VigenereStream(KEY, decrypt=True).process(message))
+
+
+def test_vigenere_decrypt_numpy(benchmark, message):
+    benchmark.group = "vigenere decrypt"
+    benchmark(vigenere_numpy.decrypt, message, KEY)
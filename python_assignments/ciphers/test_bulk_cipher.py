@@ -0,0 +1,49 @@
+import os
+import random
+import string
+import tempfile
+import unittest
+
+from . import bulk_cipher, caesar_tables
+from .vigCipher_encrypt import vigenere_encrypt as original_vigenere_encrypt
+
+
+def make_message(size, seed=0):
+    rng = random.Random(seed)
+    return "".join(rng.choice(string.ascii_letters + string.digits + " ,.!?\n") for _ in range(size))
+
+
+class BulkCipherTests(unittest.TestCase):
+    def test_run_keeps_order(self):
+        messages = [make_message(50, seed=i) for i in range(40)]
+        for cipher, expected in [
+            ("caesar-encrypt", [caesar_tables.encrypt(m, 3) for m in messages]),
+            ("vigenere-encrypt", [original_vigenere_encrypt(m, "lemon") for m in messages]),
+        ]:
+            with self.subTest(cipher=cipher):
+                key = "3" if cipher.startswith("caesar") else "lemon"
+                self.assertEqual(bulk_cipher.run(cipher, key, messages, workers=4, batch_size=1), expected)
+
+    def test_run_numpy_matches_stream(self):
+        messages = [make_message(50, seed=i) for i in range(40)]
+        for cipher in ["vigenere-encrypt", "vigenere-decrypt"]:
+            with self.subTest(cipher=cipher):
+                self.assertEqual(bulk_cipher.run(cipher, "lemon", messages, workers=2, batch_size=7, numpy=True),
+                                 bulk_cipher.run(cipher, "lemon", messages, workers=2, batch_size=7))
+
+    def test_read_messages_splits_on_newlines_only(self):
+        messages = ["page\x0cbreak", "group\x1dseparator", "next\x85line", "line\u2028separator", "", "last"]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "messages.txt")
+            for newline in ["\n", "\r\n"]:
+                with self.subTest(newline=repr(newline)):
+                    with open(path, "w", newline="") as f:
+                        f.write(newline.join(messages) + newline)
+                    self.assertEqual(bulk_cipher.read_messages(path), messages)
+            with open(path, "w") as f:
+                f.write("no trailing newline")
+            self.assertEqual(bulk_cipher.read_messages(path), ["no trailing newline"])
+
+
+if __name__ == "__main__":
+    unittest.main()
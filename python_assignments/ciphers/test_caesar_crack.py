@@ -0,0 +1,32 @@
+import unittest
+
+from . import caesar_crack, caesar_tables
+
+ENGLISH = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of "
+    "foolishness, it was the epoch of belief, it was the epoch of incredulity, it was the season of Light, "
+    "it was the season of Darkness, it was the spring of hope, it was the winter of despair, we had "
+    "everything before us, we had nothing before us, we were all going direct to Heaven, we were all going "
+    "direct the other way. In short, the period was so far like the present period, that some of its "
+    "noisiest authorities insisted on its being received, for good or for evil, in the superlative degree "
+    "of comparison only. There were a king with a large jaw and a queen with a plain face, on the throne "
+    "of England; there were a king with a large jaw and a queen with a fair face, on the throne of France. "
+    "In both countries it was clearer than crystal to the lords of the State preserves of loaves and "
+    "fishes, that things in general were settled for ever."
+)
+
+
+class CaesarCrackTests(unittest.TestCase):
+    def test_crack(self):
+        for shift in [1, 7, 13, 25]:
+            with self.subTest(shift=shift):
+                found, plaintext = caesar_crack.crack(caesar_tables.encrypt(ENGLISH, shift))
+                self.assertEqual((found, plaintext), (shift, ENGLISH))
+
+    def test_crack_many(self):
+        ciphertexts = [caesar_tables.encrypt(ENGLISH, shift) for shift in [3, 11]]
+        self.assertEqual(caesar_crack.crack_many(ciphertexts), [(3, ENGLISH), (11, ENGLISH)])
+
+
+if __name__ == "__main__":
+    unittest.main()
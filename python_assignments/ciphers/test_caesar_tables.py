@@ -0,0 +1,43 @@
+import random
+import string
+import unittest
+
+from . import caesar_tables
+from .ceasCiph_en import encrypt as original_caesar_encrypt
+
+
+def make_message(size, seed=0):
+    rng = random.Random(seed)
+    return "".join(rng.choice(string.ascii_letters + string.digits + " ,.!?\n") for _ in range(size))
+
+
+class CaesarTablesTests(unittest.TestCase):
+    def test_round_trip(self):
+        message = make_message(2000)
+        for shift in [0, 1, 13, 25, 26, -3, 40]:
+            with self.subTest(shift=shift):
+                self.assertEqual(caesar_tables.decrypt(caesar_tables.encrypt(message, shift), shift), message)
+
+    def test_keeps_case(self):
+        self.assertEqual(caesar_tables.encrypt("Hello, World! xyz", 3), "Khoor, Zruog! abc")
+
+    def test_matches_original_on_lower_case(self):
+        message = make_message(2000).lower()
+        for shift in range(26):
+            self.assertEqual(caesar_tables.encrypt(message, shift), original_caesar_encrypt(message, shift))
+
+    def test_bytes(self):
+        self.assertEqual(caesar_tables.encrypt(b"Hello, World!", 3), b"Khoor, Zruog!")
+        self.assertEqual(caesar_tables.decrypt(bytearray(b"Khoor"), 3), bytearray(b"Hello"))
+
+    def test_many(self):
+        records = [make_message(n, seed=n) for n in range(0, 300, 7)]
+        encrypted = caesar_tables.encrypt_many(records, 5)
+        self.assertEqual(encrypted, [caesar_tables.encrypt(record, 5) for record in records])
+        self.assertEqual(caesar_tables.decrypt_many(encrypted, 5), records)
+        mixed = ["Abc", b"Abc", ""]
+        self.assertEqual(caesar_tables.encrypt_many(mixed, 1), ["Bcd", b"Bcd", ""])
+
+
+if __name__ == "__main__":
+    unittest.main()
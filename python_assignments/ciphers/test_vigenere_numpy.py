@@ -0,0 +1,72 @@
+import os
+import random
+import string
+import tempfile
+import unittest
+
+from . import vigenere_numpy
+from .vigCipher_decrypt import decrypt
+from .vigCipher_encrypt import vigenere_encrypt
+
+
+def make_message(size, seed=0):
+    rng = random.Random(seed)
+    return "".join(rng.choice(string.ascii_letters + string.digits + " ,.!?\n") for _ in range(size))
+
+
+class VigenereNumpyTests(unittest.TestCase):
+    def test_encrypt_matches_original(self):
+        for key in ["a", "lemon", "KeyWord"]:
+            with self.subTest(key=key):
+                message = make_message(5000)
+                self.assertEqual(vigenere_numpy.encrypt(message, key), vigenere_encrypt(message, key.lower()))
+
+    def test_decrypt_matches_original(self):
+        for key in ["a", "lemon", "KeyWord"]:
+            with self.subTest(key=key):
+                message = make_message(5000, seed=1)
+                self.assertEqual(vigenere_numpy.decrypt(message, key), decrypt(message, key.lower()))
+
+    def test_round_trip(self):
+        message = make_message(1000, seed=2)
+        self.assertEqual(vigenere_numpy.decrypt(vigenere_numpy.encrypt(message, "lemon"), "lemon"), message.lower())
+
+    def test_non_letters_unchanged(self):
+        message = "123 ,.!? \n\t"
+        self.assertEqual(vigenere_numpy.encrypt(message, "lemon"), message)
+
+    def test_empty_key(self):
+        self.assertRaises(ValueError, vigenere_numpy.encrypt, "hello", "123")
+
+    def test_many_restarts_the_key_for_every_text(self):
+        texts = [make_message(n, seed=n) for n in range(0, 300, 7)] + ["", "Cafe au lait", "123"]
+        encrypted = vigenere_numpy.encrypt_many(texts, "lemon")
+        self.assertEqual(encrypted, [vigenere_encrypt(text, "lemon") for text in texts])
+        self.assertEqual(vigenere_numpy.decrypt_many(encrypted, "lemon"), [text.lower() for text in texts])
+        self.assertEqual(vigenere_numpy.encrypt_many([], "lemon"), [])
+
+    def test_file_matches_original_across_blocks(self):
+        message = make_message(10_000, seed=3)
+        with tempfile.TemporaryDirectory() as folder:
+            source = os.path.join(folder, "plain.txt")
+            target = os.path.join(folder, "cipher.txt")
+            with open(source, "w", newline="") as f:
+                f.write(message)
+            # A block size that does not divide the key length or the file size
+            vigenere_numpy.transform_file(source, "lemon", output=target, block_size=777)
+            with open(target, "r", newline="") as f:
+                self.assertEqual(f.read(), vigenere_encrypt(message, "lemon"))
+            # Decrypting in place restores the (lower case) original
+            vigenere_numpy.transform_file(target, "lemon", decrypt=True, block_size=1000)
+            with open(target, "r", newline="") as f:
+                self.assertEqual(f.read(), message.lower())
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "empty.txt")
+            open(path, "w").close()
+            self.assertEqual(vigenere_numpy.transform_file(path, "lemon"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import io
+import random
+import string
+import unittest
+
+from .vigCipher_decrypt import decrypt as original_vigenere_decrypt
+from .vigCipher_encrypt import vigenere_encrypt as original_vigenere_encrypt
+from .vigenere_stream import VigenereStream, stream
+
+
+def make_message(size, seed=0):
+    rng = random.Random(seed)
+    return "".join(rng.choice(string.ascii_letters + string.digits + " ,.!?\n") for _ in range(size))
+
+
+class VigenereStreamTests(unittest.TestCase):
+    def test_matches_original_across_chunks(self):
+        message = make_message(5000)
+        expected = original_vigenere_encrypt(message, "lemon")
+        for chunk_size in [1, 7, 64, 5000]:
+            with self.subTest(chunk_size=chunk_size):
+                cipher = VigenereStream("lemon")
+                chunks = [message[i:i + chunk_size] for i in range(0, len(message), chunk_size)]
+                self.assertEqual("".join(cipher.process(chunk) for chunk in chunks), expected)
+
+    def test_decrypt_matches_original(self):
+        message = make_message(3000, seed=1)
+        self.assertEqual(VigenereStream("lemon", decrypt=True).process(message),
+                         original_vigenere_decrypt(message, "lemon"))
+
+    def test_stream(self):
+        message = make_message(10_000, seed=2)
+        dst = io.StringIO()
+        self.assertEqual(stream(io.StringIO(message), dst, "lemon", chunk_size=333), len(message))
+        self.assertEqual(dst.getvalue(), original_vigenere_encrypt(message, "lemon"))
+
+    def test_key_without_letters(self):
+        self.assertRaises(ValueError, VigenereStream, "123")
+
+
+if __name__ == "__main__":
+    unittest.main()
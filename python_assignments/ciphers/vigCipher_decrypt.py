@@ -23,14 +23,12 @@ def decrypt(ciphertext, key):
 
     return decrypted_text
 
-# Encrypted message and key
-encrypted_message = input("Enter the encrypted message: ")
-key = input("Enter the key: ")
+if __name__ == "__main__":
+    # Encrypted message and key
+    encrypted_message = input("Enter the encrypted message: ")
+    key = input("Enter the key: ")
 
-# Repeat the key to match the length of the encrypted message
-repeated_key = (key * (len(encrypted_message) // len(key))) + key[:len(encrypted_message) % len(key)]
+    # The key wraps around inside decrypt, so it does not need to be repeated
+    decrypted_message = decrypt(encrypted_message, key)
 
-# Decrypt the message using the repeated key
-decrypted_message = decrypt(encrypted_message, repeated_key)
-
-print(f"Decrypted message: {decrypted_message}")
\ No newline at end of file
+    print(f"Decrypted message: {decrypted_message}")
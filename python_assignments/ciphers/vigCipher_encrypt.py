@@ -23,14 +23,12 @@ def vigenere_encrypt(plaintext, key):
 
     return encrypted_text
 
-# Plain message and key
-plain_message = input("Enter the message for encryption: ")
-key = input("Enter the key: ")
+if __name__ == "__main__":
+    # Plain message and key
+    plain_message = input("Enter the message for encryption: ")
+    key = input("Enter the key: ")
 
-# Repeat the key to match the length of the plain message
-repeated_key = (key * (len(plain_message) // len(key))) + key[:len(plain_message) % len(key)]
+    # The key wraps around inside vigenere_encrypt, so it does not need to be repeated
+    encrypted_message = vigenere_encrypt(plain_message, key)
 
-# Encrypt the message using the repeated key
-encrypted_message = vigenere_encrypt(plain_message, repeated_key)
-
-print(f"Encrypted message: {encrypted_message}")
\ No newline at end of file
+    print(f"Encrypted message: {encrypted_message}")
@@ -0,0 +1,109 @@
+"""
+ciphers/vigenere_crack.py
+
+Vigenere key recovery for ciphertexts made with vigCipher_encrypt.py.
+
+- Estimates the key length from the index of coincidence of every candidate
+  length, using Kasiski spacing of repeated trigrams to pick between lengths
+  whose index of coincidence is equally good
+- Recovers each key letter by scoring all 26 shifts of its column against
+  English letter frequencies (chi-squared)
+
+All letter counting is done with NumPy (one bincount per candidate length)
+and the key length is estimated from a prefix of the text, so ciphertexts
+of tens of MB are cracked in seconds. Only ASCII letters
+count, matching the way the key advances in vigenere_stream.py.
+
+Usage (from the python_assignments folder):
+    python3 -m ciphers vigenere-crack < message.txt
+"""
+
+import numpy as np
+
+from .caesar_crack import ENGLISH_FREQUENCIES
+from .caesar_tables import LOWER
+from .vigenere_stream import VigenereStream
+
+MAX_KEY_LENGTH = 20
+# The key length is estimated from a prefix of the text, Kasiski spacing needs even less
+LENGTH_SAMPLE = 1_000_000
+KASISKI_SAMPLE = 200_000
+# Lengths whose index of coincidence is within this ratio of the best are treated as equally good
+IOC_TOLERANCE = 0.9
+
+_FREQUENCIES = np.array(ENGLISH_FREQUENCIES)
+# _ROTATIONS[k, i] is the ciphertext letter that decrypts to plaintext letter i with key letter k
+_ROTATIONS = (np.arange(26)[None, :] - np.arange(26)[:, None]) % 26
+
+
+def letter_codes(text):
+    """Array of 0-25 codes for the ASCII letters of text (str or bytes)."""
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    raw = np.frombuffer(text, dtype=np.uint8) | 0x20
+    return raw[(raw >= ord("a")) & (raw <= ord("z"))] - ord("a")
+
+
+def column_histograms(codes, key_length):
+    """Letter counts of every key column as a (key_length, 26) array."""
+    columns = np.arange(codes.size) % key_length
+    return np.bincount(columns * 26 + codes, minlength=key_length * 26).reshape(key_length, 26)
+
+
+def index_of_coincidence(codes, key_length):
+    """Mean index of coincidence of the key columns for one candidate key length."""
+    counts = column_histograms(codes, key_length)
+    totals = counts.sum(axis=1)
+    pairs = totals * (totals - 1)
+    valid = pairs > 0
+    if not valid.any():
+        return 0.0
+    return float(((counts * (counts - 1)).sum(axis=1)[valid] / pairs[valid]).mean())
+
+
+def kasiski_scores(codes, max_key_length=MAX_KEY_LENGTH, sample=KASISKI_SAMPLE):
+    """Fraction of repeated trigram spacings divisible by each length 0..max_key_length."""
+    codes = codes[:sample].astype(np.int64)
+    scores = np.zeros(max_key_length + 1)
+    if codes.size < 3:
+        return scores
+    trigrams = codes[:-2] * 676 + codes[1:-1] * 26 + codes[2:]
+    order = np.argsort(trigrams, kind="stable")
+    repeated = trigrams[order][1:] == trigrams[order][:-1]
+    # Distance between consecutive occurrences of the same trigram
+    spacings = (order[1:] - order[:-1])[repeated]
+    if spacings.size == 0:
+        return scores
+    for length in range(1, max_key_length + 1):
+        scores[length] = np.count_nonzero(spacings % length == 0) / spacings.size
+    return scores
+
+
+def estimate_key_length(ciphertext, max_key_length=MAX_KEY_LENGTH):
+    """Most likely key length for a ciphertext."""
+    codes = letter_codes(ciphertext)[:LENGTH_SAMPLE]
+    max_key_length = max(1, min(max_key_length, codes.size // 2))
+    iocs = np.array([index_of_coincidence(codes, n) for n in range(1, max_key_length + 1)])
+    # Multiples of the real key length score as well as the length itself,
+    # Kasiski spacing favours the real length among those candidates
+    candidates = np.flatnonzero(iocs >= iocs.max() * IOC_TOLERANCE) + 1
+    kasiski = kasiski_scores(codes, max_key_length)
+    return int(candidates[np.argmax(kasiski[candidates])])
+
+
+def recover_key(ciphertext, key_length):
+    """Recovers the key letter of every column by chi-squared frequency analysis."""
+    counts = column_histograms(letter_codes(ciphertext), key_length)
+    expected = counts.sum(axis=1)[:, None, None] * _FREQUENCIES[None, None, :]
+    expected[expected == 0] = 1
+    observed = counts[:, _ROTATIONS]
+    scores = ((observed - expected) ** 2 / expected).sum(axis=2)
+    return "".join(LOWER[k] for k in scores.argmin(axis=1))
+
+
+def crack(ciphertext, max_key_length=MAX_KEY_LENGTH):
+    """Returns the most likely (key, plaintext) for a ciphertext."""
+    if isinstance(ciphertext, bytes):
+        ciphertext = ciphertext.decode("utf-8")
+    key = recover_key(ciphertext, estimate_key_length(ciphertext, max_key_length))
+    return key, VigenereStream(key, decrypt=True).process(ciphertext)
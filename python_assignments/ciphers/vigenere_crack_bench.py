@@ -0,0 +1,47 @@
+"""
+ciphers/vigenere_crack_bench.py
+
+Times vigenere_crack.crack against ciphertext length and key length.
+
+The plaintext is random letters drawn with English frequencies, encrypted
+with the vigCipher_encrypt.py rule (plaintext letter minus key letter).
+
+Usage:
+    python3 -m ciphers.vigenere_crack_bench
+"""
+
+import time
+
+import numpy as np
+
+from . import vigenere_crack as vc
+from .caesar_crack import ENGLISH_FREQUENCIES
+from .caesar_tables import LOWER
+
+LENGTHS = [10_000, 100_000, 1_000_000, 10_000_000]
+KEY_LENGTHS = [3, 7, 13]
+
+
+def make_ciphertext(length, key, rng):
+    probabilities = np.array(ENGLISH_FREQUENCIES) / sum(ENGLISH_FREQUENCIES)
+    plain = rng.choice(26, size=length, p=probabilities)
+    key_codes = np.array([LOWER.index(k) for k in key])
+    cipher = (plain - key_codes[np.arange(length) % len(key)]) % 26
+    return (cipher + ord("a")).astype(np.uint8).tobytes()
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'length':>12} {'key length':>11} {'seconds':>9} {'MB/s':>8}  recovered")
+    for key_length in KEY_LENGTHS:
+        key = "".join(rng.choice(list(LOWER), size=key_length))
+        for length in LENGTHS:
+            ciphertext = make_ciphertext(length, key, rng)
+            start = time.perf_counter()
+            found = vc.recover_key(ciphertext, vc.estimate_key_length(ciphertext))
+            elapsed = time.perf_counter() - start
+            print(f"{length:>12,} {key_length:>11} {elapsed:>9.3f} {length / elapsed / 1e6:>8.1f}  {found == key}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+ciphers/vigenere_numpy.py
+
+NumPy backend for the Vigenere cipher.
+
+Text is viewed as a uint8 array and processed in place: letters are found
+with one vectorized comparison and gathered into their own array, the key
+shifts are tiled along the gathered letters (so non-letters never use up a
+key letter and no per-byte key index is built), and the shifted letters are
+written back into the same buffer.
+Files are memory-mapped and processed block by block, carrying the key
+position across blocks, so large corpora never have to fit in memory.
+
+Results match vigCipher_encrypt.vigenere_encrypt and vigCipher_decrypt.decrypt
+for ASCII text: letters come out lower case and every other byte passes
+through unchanged.
+"""
+
+import os
+import shutil
+
+import numpy as np
+
+BLOCK_SIZE = 1 << 24
+
+
+def key_shifts(key, decrypt=False):
+    """Per key letter shift as a uint8 array, encrypting subtracts and decrypting adds."""
+    codes = np.frombuffer(key.lower().encode("ascii", "ignore"), dtype=np.uint8)
+    codes = codes[(codes >= ord("a")) & (codes <= ord("z"))].astype(np.int16) - ord("a")
+    if codes.size == 0:
+        raise ValueError("Key must contain at least one letter")
+    return (codes if decrypt else -codes % 26).astype(np.uint8)
+
+
+def transform(buffer, shifts, offset=0):
+    """Encrypts or decrypts a writable uint8 array in place.
+
+    offset is the key position of the first letter in buffer. Returns the
+    key position of the letter after the end of buffer.
+    """
+    # Letter codes 0-25, anything else ends up at 26 or above
+    codes = buffer | 0x20
+    codes -= ord("a")
+    is_letter = codes < 26
+    letters = codes[is_letter]
+    count = letters.size
+    # The key starting at offset, repeated over the letters only
+    letters += np.tile(np.roll(shifts, -offset), -(-count // shifts.size))[:count]
+    # Codes are 0-50 here and taking 26 off wraps the ones below 26 around to 230 or
+    # more, so the minimum of the two is the code mod 26 without a division
+    np.minimum(letters, letters - 26, out=letters)
+    letters += ord("a")
+    buffer[is_letter] = letters
+    return (offset + count) % shifts.size
+
+
+def _transform_text(text, key, decrypt):
+    data = bytearray(text.encode("utf-8"))
+    transform(np.frombuffer(data, dtype=np.uint8), key_shifts(key, decrypt))
+    return data.decode("utf-8")
+
+
+def encrypt(plaintext, key):
+    """Vectorized vigCipher_encrypt.vigenere_encrypt."""
+    return _transform_text(plaintext, key, decrypt=False)
+
+
+def decrypt(ciphertext, key):
+    """Vectorized vigCipher_decrypt.decrypt."""
+    return _transform_text(ciphertext, key, decrypt=True)
+
+
+def transform_many(texts, key, decrypt=False):
+    """Encrypts or decrypts a list of str, every text starting at the start of the key.
+
+    All texts go through NumPy as one buffer, so a batch of short messages costs
+    a handful of array operations instead of a handful per message.
+    """
+    shifts = key_shifts(key, decrypt)
+    encoded = [text.encode("utf-8") for text in texts]
+    sizes = np.array([len(text) for text in encoded], dtype=np.intp)
+    ends = np.cumsum(sizes)
+    data = bytearray(b"".join(encoded))
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    codes = buffer | 0x20
+    codes -= ord("a")
+    is_letter = codes < 26
+    letters = codes[is_letter]
+    # Letters before the start of each text, and each letter's position in its own text
+    letters_before = np.concatenate(([0], np.cumsum(is_letter, dtype=np.intp)))[np.concatenate(([0], ends))]
+    position = np.arange(letters.size) - np.repeat(letters_before[:-1], np.diff(letters_before))
+    position %= shifts.size
+    letters += shifts[position]
+    np.minimum(letters, letters - 26, out=letters)
+    letters += ord("a")
+    buffer[is_letter] = letters
+    starts = ends - sizes
+    return [data[start:end].decode("utf-8") for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+def encrypt_many(texts, key):
+    """Encrypts every record in texts with the same key and returns a list."""
+    return transform_many(texts, key)
+
+
+def decrypt_many(texts, key):
+    """Decrypts every record in texts with the same key and returns a list."""
+    return transform_many(texts, key, decrypt=True)
+
+
+def transform_file(path, key, decrypt=False, output=None, block_size=BLOCK_SIZE):
+    """Encrypts or decrypts a file through a memory map.
+
+    The file is changed in place unless output is given, in which case it is
+    copied there first and the copy is changed. Returns the number of bytes
+    processed.
+    """
+    if output is not None:
+        shutil.copyfile(path, output)
+        path = output
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0
+    shifts = key_shifts(key, decrypt)
+    data = np.memmap(path, dtype=np.uint8, mode="r+")
+    offset = 0
+    for start in range(0, size, block_size):
+        offset = transform(data[start:start + block_size], shifts, offset)
+    data.flush()
+    del data
+    return size
@@ -0,0 +1,113 @@
+"""
+ciphers/vigenere_stream.py
+
+Streaming Vigenere cipher for files and stdin.
+
+Uses the same rules as vigCipher_encrypt.py and vigCipher_decrypt.py
+(encrypting subtracts the key letter, decrypting adds it, output is lower
+case and only letters move the key forward), but reads the input in fixed
+size blocks and writes each block out as soon as it is processed.
+The key position is carried across block boundaries, so the repeated key
+is never built and memory stays flat no matter how large the input is.
+
+Usage:
+    python3 -m ciphers stream encrypt KEY [input_file] [-o output_file]
+    python3 -m ciphers stream decrypt KEY [input_file] [-o output_file]
+    python3 -m ciphers stream encrypt KEY input_file -o output_file --numpy
+
+With no input file the message is read from stdin. --numpy processes a file
+through a memory map with vigenere_numpy instead, bytes are kept as they are
+so Windows line endings are not turned into "\n".
+"""
+
+import argparse
+import string
+import sys
+
+ALPHABET = string.ascii_lowercase
+CHUNK_SIZE = 1 << 16
+
+# Maps both cases of every letter to its position in the alphabet
+LETTER_INDEX = {letter: i for i, letter in enumerate(ALPHABET)}
+LETTER_INDEX.update({letter.upper(): i for letter, i in list(LETTER_INDEX.items())})
+
+
+class VigenereStream:
+    """Encrypts or decrypts consecutive chunks of one message."""
+
+    def __init__(self, key, decrypt=False):
+        shifts = [LETTER_INDEX[k] for k in key if k in LETTER_INDEX]
+        if not shifts:
+            raise ValueError("Key must contain at least one letter")
+        # Encrypting subtracts the key letter and decrypting adds it
+        self.shifts = shifts if decrypt else [-s % 26 for s in shifts]
+        # Position in the key of the next letter to process
+        self.offset = 0
+
+    def process(self, chunk):
+        shifts = self.shifts
+        key_len = len(shifts)
+        offset = self.offset
+        out = []
+        for char in chunk:
+            char_index = LETTER_INDEX.get(char)
+            if char_index is None:
+                # Non-letters pass through and do not use up a key letter
+                out.append(char)
+            else:
+                out.append(ALPHABET[(char_index + shifts[offset]) % 26])
+                offset += 1
+                if offset == key_len:
+                    offset = 0
+        self.offset = offset
+        return "".join(out)
+
+
+def stream(src, dst, key, decrypt=False, chunk_size=CHUNK_SIZE):
+    """Reads src block by block and writes the processed text to dst.
+
+    Returns the number of characters processed.
+    """
+    cipher = VigenereStream(key, decrypt)
+    total = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        dst.write(cipher.process(chunk))
+        total += len(chunk)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a file or stdin through the Vigenere cipher.")
+    parser.add_argument("mode", choices=["encrypt", "decrypt"])
+    parser.add_argument("key")
+    parser.add_argument("input", nargs="?", help="file to read, defaults to stdin")
+    parser.add_argument("-o", "--output", help="file to write, defaults to stdout")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--numpy", action="store_true", help="process the file with NumPy, needs input and -o")
+    args = parser.parse_args(argv)
+
+    if args.numpy:
+        if not args.input or not args.output:
+            parser.error("--numpy needs an input file and -o")
+        # NumPy is optional for the rest of the package, so it is imported on demand
+        from . import vigenere_numpy
+
+        vigenere_numpy.transform_file(args.input, args.key, args.mode == "decrypt", output=args.output)
+        return
+
+    src = open(args.input, "r") if args.input else sys.stdin
+    dst = open(args.output, "w") if args.output else sys.stdout
+    try:
+        stream(src, dst, args.key, args.mode == "decrypt", args.chunk_size)
+    finally:
+        if args.input:
+            src.close()
+        if args.output:
+            dst.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Times wall collision checks in compute_robot_logic on large generated mazes.
+#
+# Each maze is made by robot_race_mazegen with some extra openings and has
+# one goal and as many bots as there are bot names. The old list of Wall
+# objects is timed for a single collision check to show what one lookup
+# cost before the occupancy grid.
+#
+# Run with: python3 benchmark_collisions.py
+
+import random as rand
+from time import perf_counter
+
+import robot_race_functions as rr
+from robot_race_mazegen import MAX_BOTS, generate_maze
+
+maze_sizes = [101, 301, 1001]
+num_bots = MAX_BOTS
+num_turns = 20
+extra_openings = 0.2
+
+
+def main():
+    print(f"{'maze':>11} {'walls':>9} {'init s':>8} {'moves/s':>10} {'list scan s':>12}")
+    for size in maze_sizes:
+        maze_data = generate_maze(size, size, num_bots, seed=0, extra_openings=extra_openings)
+
+        start = perf_counter()
+        walls, goal, bots = rr.process_maze_init(maze_data)
+        init_time = perf_counter() - start
+
+        rand.seed(0)
+        moves = 0
+        start = perf_counter()
+        for _ in range(num_turns):
+            for bot in bots:
+                if not bot.has_finished:
+                    rr.compute_robot_logic(walls, goal, bot)
+                    moves += 1
+        move_rate = moves / (perf_counter() - start)
+
+        # One collision check the way it was done before, scanning every wall
+        wall_list = list(walls)
+        start = perf_counter()
+        any(w.x == goal.x and w.y == goal.y for w in wall_list)
+        scan_time = perf_counter() - start
+
+        print(f"{size:>5}x{size:<5} {len(wall_list):>9,} {init_time:>8.3f} {move_rate:>10,.0f} {scan_time:>12.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# Compares the optimal pathfinding bot with the random/greedy heuristic.
+#
+# For each maze both strategies race the same bots. The optimal bot pays for
+# one breadth first search per maze (timed separately as "field s") and then
+# every move is a lookup.
+#
+# Run with: python3 benchmark_pathfinding.py
+
+import random as rand
+from time import perf_counter
+
+import robot_race_functions as rr
+import robot_race_pathfinding as rp
+from robot_race_mazegen import MAX_BOTS, generate_maze
+
+maze_files = ['maze_data_1.csv', 'maze_data_2.csv', 'maze_data_3.csv']
+generated_sizes = [101, 301, 1001]
+num_bots = MAX_BOTS
+max_turns = 200
+
+
+def race(maze_data, logic, max_turns):
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    start = perf_counter()
+    robot_moves = rr.compute_race_moves(walls, goal, bots, max_turns, rand.Random(0), logic)
+    elapsed = perf_counter() - start
+    finished = sum(bot.has_finished for bot in bots)
+    return len(robot_moves), finished, len(bots), elapsed
+
+
+def main():
+    mazes = [(name, rr.read_maze(name)) for name in maze_files]
+    mazes += [(f'{size}x{size}', generate_maze(size, size, num_bots, seed=0, extra_openings=0.2)) for size in generated_sizes]
+
+    print(f"{'maze':<16} {'strategy':<10} {'field s':>8} {'race s':>8} {'moves':>9} {'finished':>10}")
+    for name, maze_data in mazes:
+        rp.clear_distance_cache()
+        walls, goal, _ = rr.process_maze_init(maze_data)
+        start = perf_counter()
+        rp.distance_field(walls, goal)
+        field_time = perf_counter() - start
+
+        for strategy, logic, field in [('heuristic', rr.compute_robot_logic, '-'),
+                                       ('optimal', rp.compute_optimal_robot_logic, f'{field_time:.3f}')]:
+            moves, finished, bots, elapsed = race(maze_data, logic, max_turns)
+            print(f"{name:<16} {strategy:<10} {field:>8} {elapsed:>8.3f} {moves:>9,} {finished:>5}/{bots:<4}")
+
+
+if __name__ == '__main__':
+    main()
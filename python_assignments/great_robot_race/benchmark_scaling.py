@@ -0,0 +1,60 @@
+# Scaling benchmark for the great robot race engine.
+#
+# Generates seeded mazes of increasing size and bot count with
+# robot_race_mazegen and times the three parts of a race:
+#   init   process_maze_init on the parsed maze
+#   move   one compute_robot_logic call (averaged over the first turns)
+#   race   a full race with compute_race_moves
+# The mazes and the random moves are seeded, so runs are comparable and a
+# slower time for the same row points at a regression.
+#
+# Run with: python3 benchmark_scaling.py
+
+import random as rand
+from time import perf_counter
+
+import robot_race_functions as rr
+from robot_race_mazegen import MAX_BOTS, generate_maze
+
+maze_sizes = [21, 51, 101, 501, 1001]
+bot_counts = [10, MAX_BOTS]
+timed_turns = 10
+max_turns = 100
+extra_openings = 0.1
+
+
+def time_maze(size, num_bots):
+    maze_data = generate_maze(size, size, num_bots, seed=size, extra_openings=extra_openings)
+
+    start = perf_counter()
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    init_time = perf_counter() - start
+
+    rng = rand.Random(0)
+    calls = 0
+    start = perf_counter()
+    for _ in range(timed_turns):
+        for bot in bots:
+            if not bot.has_finished:
+                rr.compute_robot_logic(walls, goal, bot, rng)
+                calls += 1
+    move_time = (perf_counter() - start) / max(calls, 1)
+
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    start = perf_counter()
+    robot_moves = rr.compute_race_moves(walls, goal, bots, max_turns, rand.Random(0))
+    race_time = perf_counter() - start
+    return init_time, move_time, race_time, len(robot_moves)
+
+
+def main():
+    print(f"{'maze':>11} {'bots':>5} {'init ms':>9} {'move us':>8} {'race ms':>9} {'moves':>8}")
+    for size in maze_sizes:
+        for num_bots in bot_counts:
+            init_time, move_time, race_time, moves = time_maze(size, num_bots)
+            print(f"{size:>5}x{size:<5} {num_bots:>5} {init_time * 1e3:>9.2f} {move_time * 1e6:>8.2f} "
+                  f"{race_time * 1e3:>9.2f} {moves:>8,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 # Import the robot race functions and other useful libraries
 import robot_race_functions as rr
-from collections import deque, Counter, namedtuple
+from robot_race_movelog import logged_moves
+from robot_race_render import MazeRenderer
 from time import time, sleep
 
 # Define maze file that will be used
@@ -10,40 +11,35 @@ maze_file_name = 'maze_data_1.csv'
 seconds_between_turns = 0.3
 max_turns = 35
 
+# Set to a file name to record every move, ending in .ndjson for a text log or anything else
+# for a compact binary one. Replay or analyze it later with robot_race_movelog.py
+move_log_file = None
+
 # Initialize the robot race
 maze_data = rr.read_maze(maze_file_name)
-rr.print_maze(maze_data)
 walls, goal, bots = rr.process_maze_init(maze_data)
+renderer = MazeRenderer(maze_data, bots)
+renderer.draw()
 
-# Populate a deque of all robot commands for the provided maze
-robot_moves = deque()
-num_of_turns = 0
-while not rr.is_race_over(bots) and num_of_turns < max_turns:
-  # For each bot, if the bot has not reached the goal, add a new move to robot_moves deque
-  for bot in bots:
-    if bot.has_finished == False:
-      robot_moves.append(rr.compute_robot_logic(walls, goal, bot))
-  num_of_turns += 1
-  
-move_count = Counter(move[0] for move in robot_moves)
-collision_count = Counter(move[0] for move in robot_moves if move[2] == True)
-
-BotScoreData = namedtuple('BotScoreData', ['name', 'num_moves', 'num_collisions', 'score'])
-
-bot_scores = []
-for bot in bots:
-  bot_scores.append(BotScoreData(bot.name, move_count[bot.name], collision_count[bot.name], move_count[bot.name] + collision_count[bot.name]))
+# Moves are computed and applied one at a time, so the race is never held in memory
+robot_moves = rr.iter_race_moves(walls, goal, bots, max_turns)
+if move_log_file:
+  robot_moves = logged_moves(robot_moves, move_log_file)
 
 bot_data = {}
 for bot in bots:
   bot_data[bot.name] = bot
-  
-while len(robot_moves) > 0:
-  bot_name, direction, has_collided = robot_moves.popleft()
-  bot_data[bot_name].process_move(direction)
-  rr.update_maze_characters(maze_data, bots)
-  rr.print_maze(maze_data)
-  sleep(seconds_between_turns - time() % seconds_between_turns)
-  
+
+def applied_moves(robot_moves):
+  # Applies and draws each move before passing it on, so score_moves counts the race as it plays
+  for move in robot_moves:
+    bot_name, direction, has_collided = move
+    bot_data[bot_name].process_move(direction)
+    # Only the cells the bot left and entered are redrawn
+    renderer.update()
+    sleep(seconds_between_turns - time() % seconds_between_turns)
+    yield move
+
+move_count, collision_count = rr.score_moves(applied_moves(robot_moves))
+bot_scores = rr.bot_score_data([bot.name for bot in bots], move_count, collision_count)
 rr.print_results(bot_scores)
-  
\ No newline at end of file
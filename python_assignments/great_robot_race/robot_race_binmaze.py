@@ -0,0 +1,111 @@
+# Compact binary maze format for the great robot race.
+#
+# read_maze turns every cell of a maze_data_*.csv file into its own Python
+# string, which takes gigabytes for very large mazes. A .rrmz file stores
+# one byte per cell (the same character as in the CSV) and is loaded with a
+# NumPy memmap, so opening even a 10k x 10k maze is instant and the cells
+# are only read from disk when used.
+#
+# Layout (little endian):
+#   header    magic b'RRMZ', version (uint16), width, height, goal x, goal y,
+#             number of bots (uint32 each)
+#   cells     width * height bytes, row by row
+#   bots      name (1 byte), x, y (uint32 each) per bot
+#
+# Convert a CSV maze with: python3 robot_race_binmaze.py maze_data_1.csv maze_data_1.rrmz
+
+import argparse
+import csv
+import os
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+import robot_race_functions as rr
+
+MAGIC = b'RRMZ'
+VERSION = 1
+HEADER = struct.Struct('<4sHIIIII')
+BOT = struct.Struct('<cII')
+NO_GOAL = 0xFFFFFFFF
+
+# bots is a tuple of (name, x, y) for each bot's starting cell
+BinaryMaze = namedtuple('BinaryMaze', ['grid', 'goal', 'bots'])
+
+
+def convert_csv(csv_path, out_path):
+    # Streams a CSV maze into the binary format row by row, so the CSV never has to fit in memory.
+    # The file is written next to out_path first and only renamed into place once the whole CSV
+    # is valid, so a bad maze never leaves a half-written .rrmz behind
+    tmp_path = out_path + '.tmp'
+    try:
+        with open(csv_path, 'r') as csvfile, open(tmp_path, 'wb') as out:
+            _write_binary(csv.reader(csvfile), out)
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _write_binary(rows, out):
+    width = height = 0
+    goal = (NO_GOAL, NO_GOAL)
+    bots = []
+    out.write(b'\0' * HEADER.size)
+    for r, row in enumerate(rows):
+        if r == 0:
+            width = len(row)
+        elif len(row) != width:
+            raise ValueError(f'Row {r} has {len(row)} cells, expected {width}')
+        line = ''.join(row)
+        # Every cell has to be exactly one byte in the file
+        if not all(len(col) == 1 for col in row) or not line.isascii():
+            raise ValueError(f'Row {r} has a cell that is not a single ASCII character')
+        for c, col in enumerate(row):
+            if col == '$':
+                goal = (c, r)
+            elif col.isalpha():
+                bots.append((col, c, r))
+        out.write(line.encode('ascii'))
+        height += 1
+    for name, x, y in bots:
+        out.write(BOT.pack(name.encode('ascii'), x, y))
+    out.seek(0)
+    out.write(HEADER.pack(MAGIC, VERSION, width, height, goal[0], goal[1], len(bots)))
+
+
+def load(path):
+    # Opens a .rrmz file and returns a BinaryMaze with the cells as a read-only (height, width) memmap
+    with open(path, 'rb') as f:
+        magic, version, width, height, goal_x, goal_y, num_bots = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} robot race maze file')
+        f.seek(HEADER.size + width * height)
+        bot_data = f.read(BOT.size * num_bots)
+    grid = np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER.size, shape=(height, width))
+    goal = None if goal_x == NO_GOAL else rr.Goal(goal_x, goal_y)
+    bots = tuple((name.decode('ascii'), x, y) for name, x, y in BOT.iter_unpack(bot_data))
+    return BinaryMaze(grid, goal, bots)
+
+
+def process_binary_maze_init(maze):
+    # Same result as process_maze_init, built straight from the memmapped cells. The bots
+    # are new Robot objects every time, so one loaded maze can be raced again and again
+    height, width = maze.grid.shape
+    cells = bytearray(width * height)
+    np.equal(maze.grid, ord('#'), out=np.frombuffer(cells, dtype=bool).reshape(height, width))
+    bots = [rr.Robot(x, y, name) for name, x, y in maze.bots]
+    return [rr.WallGrid(width, height, cells), maze.goal, bots]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a CSV robot race maze to the binary format.")
+    parser.add_argument('csv_file')
+    parser.add_argument('output_file')
+    args = parser.parse_args()
+    convert_csv(args.csv_file, args.output_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,10 @@
 import csv
 import random as rand
+import re
+from collections import Counter, deque, namedtuple
+
+BotScoreData = namedtuple('BotScoreData', ['name', 'num_moves', 'num_collisions', 'score'])
+
 
 def read_maze(name):
     maze_chars = []
@@ -11,12 +16,8 @@ def read_maze(name):
 
 
 def print_maze(maze_data):
-    for row in maze_data:
-        printed_row = ''
-        for col in row:
-            printed_row += col + '  '
-        print(printed_row)
-    print('\n')
+    # Builds the whole maze as one string so it is written in a single call
+    print(''.join(''.join(col + '  ' for col in row) + '\n' for row in maze_data) + '\n')
 
 def is_race_over(bots):
     done = True
@@ -36,47 +37,58 @@ def print_results(bot_score_data):
         place += 1
 
 
+# Translation table that turns a row of maze characters into wall grid bytes
+WALL_CELLS = bytes(1 if i == ord('#') else 0 for i in range(256))
+NOT_WALL_OR_FLOOR = re.compile('[^#_]')
+
+
 def process_maze_init(maze_data):
-    walls = []
+    width = max((len(row) for row in maze_data), default=0)
+    walls = WallGrid(width, len(maze_data))
     goal = None
     bots = []
     for r, row in enumerate(maze_data):
-        for c, col in enumerate(row):
-            if col == '#':
-                walls.append(Wall(c,r))
-            elif col == '$':
+        if not all(len(col) == 1 for col in row):
+            # Cells that are not a single character, check them one by one
+            for c, col in enumerate(row):
+                if col == '#':
+                    walls.add(c,r)
+            row_cells = enumerate(row)
+        else:
+            # Fill the whole row of the wall grid at once and only visit the cells
+            # that are not walls or floor
+            row_text = ''.join(row)
+            walls.cells[r * width:r * width + len(row)] = row_text.encode('ascii', 'replace').translate(WALL_CELLS)
+            row_cells = ((m.start(), m.group()) for m in NOT_WALL_OR_FLOOR.finditer(row_text))
+        for c, col in row_cells:
+            if col == '$':
                 goal = Goal(c,r)
             elif col.isalpha():
                 bots.append(Robot(c,r, col))
     return [walls, goal, bots]
 
 
-def compute_robot_logic(walls, goal, bot):
+def compute_robot_logic(walls, goal, bot, rng=rand):
+    # rng can be a random.Random instance to make a race reproducible
     moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
     move_names = {(-1, 0): 'left', (1, 0): 'right', (0, -1): 'down', (0, 1): 'up', (0, 0): 'nothing'}
 
-    selected_move = moves[rand.randint(0,3)]
+    selected_move = moves[rng.randint(0,3)]
     move_dist = []
     for m, move in enumerate(moves):
         dist = calc_manhattan_dist(bot.calc_x + move[0], bot.calc_y + move[1], goal.x, goal.y)
         move_dist.append([m,dist])
     move_dist.sort(key=lambda x: x[1])
-    if rand.random() < 0.45:
+    if rng.random() < 0.45:
         selected_move = moves[move_dist[0][0]]
 
-    hit_wall = False
-    for wall in walls:
-        if bot.calc_x + selected_move[0] == wall.x and bot.calc_y + selected_move[1] == wall.y:
-            hit_wall = True
+    hit_wall = (bot.calc_x + selected_move[0], bot.calc_y + selected_move[1]) in walls
 
     found_alternate_move = False
     if hit_wall:
         for next_move in move_dist:
             move = moves[next_move[0]]
-            hit_wall_move = False
-            for wall in walls:
-                if bot.calc_x + move[0] == wall.x and bot.calc_y + move[1] == wall.y:
-                    hit_wall_move = True
+            hit_wall_move = (bot.calc_x + move[0], bot.calc_y + move[1]) in walls
 
             if not hit_wall_move:
                 selected_move = move
@@ -97,6 +109,40 @@ def compute_robot_logic(walls, goal, bot):
     return bot.name, move_names[selected_move], hit_wall
 
 
+def iter_race_moves(walls, goal, bots, max_turns, rng=rand, logic=None):
+    # Runs the race until every bot finishes or max_turns is reached, yielding each move as it
+    # is computed so the caller can apply it right away without keeping the whole race.
+    # logic is the bot strategy, a function with the same arguments as compute_robot_logic
+    logic = logic or compute_robot_logic
+    num_of_turns = 0
+    while not is_race_over(bots) and num_of_turns < max_turns:
+        for bot in bots:
+            if not bot.has_finished:
+                yield logic(walls, goal, bot, rng)
+        num_of_turns += 1
+
+
+def compute_race_moves(walls, goal, bots, max_turns, rng=rand, logic=None):
+    # Same as iter_race_moves but returns all moves of the race in a deque
+    return deque(iter_race_moves(walls, goal, bots, max_turns, rng, logic))
+
+
+def score_moves(robot_moves):
+    # Counts the moves and collisions of each bot from any iterable of moves, one move at a time
+    move_count = Counter()
+    collision_count = Counter()
+    for bot_name, direction, has_collided in robot_moves:
+        move_count[bot_name] += 1
+        if has_collided:
+            collision_count[bot_name] += 1
+    return move_count, collision_count
+
+
+def bot_score_data(bot_names, move_count, collision_count):
+    return [BotScoreData(name, move_count[name], collision_count[name], move_count[name] + collision_count[name])
+            for name in bot_names]
+
+
 def update_maze_characters(old_maze_chars, bots):
     to_replace = []
     for r, row in enumerate(old_maze_chars):
@@ -118,6 +164,8 @@ def calc_manhattan_dist(x1, y1, x2, y2):
 
 
 class Robot:
+    __slots__ = ('x', 'calc_x', 'y', 'calc_y', 'has_finished', 'remove', 'name')
+
     def __init__(self, x, y, name):
         self.x = x
         self.calc_x = x
@@ -141,12 +189,47 @@ class Robot:
 
 
 class Wall:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
 
 
+class WallGrid:
+    # Occupancy grid of the maze walls, one byte per cell, so checking a
+    # position for a wall is a single lookup instead of a scan of every wall.
+    # Walls are never stored as separate objects, iterating creates Wall views
+    # on the fly
+    __slots__ = ('width', 'height', 'cells')
+
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        # cells can be passed in pre-filled, one byte per cell row by row, 1 for a wall
+        self.cells = bytearray(width * height) if cells is None else cells
+
+    def add(self, x, y):
+        self.cells[y * self.width + x] = 1
+
+    def __contains__(self, position):
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height and self.cells[y * self.width + x] == 1
+
+    def __len__(self):
+        return self.cells.count(1)
+
+    def __iter__(self):
+        width = self.width
+        i = self.cells.find(1)
+        while i != -1:
+            yield Wall(i % width, i // width)
+            i = self.cells.find(1, i + 1)
+
+
 class Goal:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
\ No newline at end of file
@@ -0,0 +1,82 @@
+# Seeded maze generator for the great robot race.
+#
+# Carves a maze with the recursive backtracker algorithm (using an explicit
+# stack, so very large mazes do not hit the recursion limit) and writes it in
+# the same '#' / '_' / '$' / letter CSV format as the maze_data_*.csv files.
+# The same seed always gives the same maze.
+#
+# Bots are named A-Z then a-z. The race scripts tell bots apart by name, so
+# a maze holds at most 52 bots.
+#
+# Run with: python3 robot_race_mazegen.py 101 101 20 --seed 1 -o maze_data_big.csv
+
+import argparse
+import csv
+import random as rand
+import string
+
+bot_names = string.ascii_uppercase + string.ascii_lowercase
+MAX_BOTS = len(bot_names)
+
+
+def generate_maze(rows, cols, num_bots, seed=None, extra_openings=0.0):
+    # Returns maze_data like read_maze. Cells at odd (row, col) are rooms joined by carved
+    # passages, extra_openings is the chance of knocking down each remaining inner wall to
+    # give the maze loops
+    if rows < 3 or cols < 3:
+        raise ValueError('A maze needs at least 3 rows and 3 columns')
+    if num_bots > MAX_BOTS:
+        raise ValueError(f'A maze can have at most {MAX_BOTS} bots, one for each bot name')
+    rng = rand.Random(seed)
+    maze_data = [['#'] * cols for _ in range(rows)]
+
+    start = (1, 1)
+    maze_data[1][1] = '_'
+    stack = [start]
+    while stack:
+        r, c = stack[-1]
+        neighbours = [(r + dr, c + dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                      if 0 < r + dr < rows - 1 and 0 < c + dc < cols - 1 and maze_data[r + dr][c + dc] == '#']
+        if not neighbours:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(neighbours)
+        maze_data[(r + nr) // 2][(c + nc) // 2] = '_'
+        maze_data[nr][nc] = '_'
+        stack.append((nr, nc))
+
+    if extra_openings:
+        for r in range(1, rows - 1):
+            for c in range(1, cols - 1):
+                if maze_data[r][c] == '#' and (r % 2 == 1 or c % 2 == 1) and rng.random() < extra_openings:
+                    maze_data[r][c] = '_'
+
+    open_cells = [(r, c) for r in range(rows) for c in range(cols) if maze_data[r][c] == '_']
+    if num_bots + 1 > len(open_cells):
+        raise ValueError(f'Maze only has room for {len(open_cells) - 1} bots')
+    (goal_r, goal_c), *starts = rng.sample(open_cells, num_bots + 1)
+    maze_data[goal_r][goal_c] = '$'
+    for i, (r, c) in enumerate(starts):
+        maze_data[r][c] = bot_names[i]
+    return maze_data
+
+
+def write_maze(maze_data, name):
+    with open(name, 'w', newline='') as csvfile:
+        csv.writer(csvfile, lineterminator='\n').writerows(maze_data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a robot race maze CSV file.")
+    parser.add_argument('rows', type=int)
+    parser.add_argument('cols', type=int)
+    parser.add_argument('bots', type=int)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--extra-openings', type=float, default=0.0)
+    parser.add_argument('-o', '--output', default='maze_data_generated.csv')
+    args = parser.parse_args()
+    write_maze(generate_maze(args.rows, args.cols, args.bots, args.seed, args.extra_openings), args.output)
+
+
+if __name__ == '__main__':
+    main()
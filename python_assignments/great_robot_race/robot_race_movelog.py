@@ -0,0 +1,107 @@
+# Move logs for the great robot race.
+#
+# A race can be written move by move while it runs, so nothing but the
+# current move is held in memory, and read back later to replay it or to
+# count moves and collisions with score_moves.
+#
+# Two formats, picked by file extension:
+#   .ndjson   one JSON list per line: ["A", "left", false]
+#   other     binary, a b'RRML' header then 3 bytes per move:
+#             bot name, direction code, collided flag
+#
+# Run with:
+#   python3 robot_race_movelog.py stats race.moves
+#   python3 robot_race_movelog.py replay maze_data_1.csv race.moves
+
+import argparse
+import json
+from time import sleep
+
+import robot_race_functions as rr
+from robot_race_render import MazeRenderer
+
+MAGIC = b'RRML'
+DIRECTIONS = ['left', 'right', 'down', 'up', 'nothing', 'finished']
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+def is_ndjson(path):
+    return path.endswith('.ndjson')
+
+
+def logged_moves(robot_moves, path):
+    # Writes every move to the log at path while passing it on unchanged
+    with open(path, 'w' if is_ndjson(path) else 'wb') as log:
+        if is_ndjson(path):
+            for move in robot_moves:
+                log.write(json.dumps(move) + '\n')
+                yield move
+        else:
+            log.write(MAGIC)
+            for move in robot_moves:
+                bot_name, direction, has_collided = move
+                log.write(bot_name.encode('ascii') + bytes((DIRECTION_CODES[direction], has_collided)))
+                yield move
+
+
+def write_moves(robot_moves, path):
+    # Writes a whole iterable of moves to a log
+    for _ in logged_moves(robot_moves, path):
+        pass
+
+
+def read_moves(path, buffer_size=1 << 16):
+    # Yields the moves of a log one at a time
+    if is_ndjson(path):
+        with open(path, 'r') as log:
+            for line in log:
+                bot_name, direction, has_collided = json.loads(line)
+                yield bot_name, direction, has_collided
+        return
+    with open(path, 'rb') as log:
+        if log.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path} is not a robot race move log')
+        leftover = b''
+        while True:
+            block = log.read(buffer_size)
+            if not block:
+                break
+            data = leftover + block
+            end = len(data) - len(data) % 3
+            for i in range(0, end, 3):
+                yield chr(data[i]), DIRECTIONS[data[i + 1]], bool(data[i + 2])
+            leftover = data[end:]
+
+
+def replay(maze_data, robot_moves, seconds_between_turns=0.3):
+    # Replays moves on the maze they were recorded on, drawing every move
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    renderer = MazeRenderer(maze_data, bots)
+    renderer.draw()
+    bot_data = {bot.name: bot for bot in bots}
+    for bot_name, direction, has_collided in robot_moves:
+        bot_data[bot_name].process_move(direction)
+        renderer.update()
+        sleep(seconds_between_turns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze or replay a robot race move log.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    stats = commands.add_parser('stats')
+    stats.add_argument('log_file')
+    replay_parser = commands.add_parser('replay')
+    replay_parser.add_argument('maze_file')
+    replay_parser.add_argument('log_file')
+    replay_parser.add_argument('--seconds-between-turns', type=float, default=0.3)
+    args = parser.parse_args()
+
+    if args.command == 'stats':
+        move_count, collision_count = rr.score_moves(read_moves(args.log_file))
+        rr.print_results(rr.bot_score_data(sorted(move_count), move_count, collision_count))
+    else:
+        replay(rr.read_maze(args.maze_file), read_moves(args.log_file), args.seconds_between_turns)
+
+
+if __name__ == '__main__':
+    main()
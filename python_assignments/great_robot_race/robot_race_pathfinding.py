@@ -0,0 +1,95 @@
+# Optimal strategy bot for the great robot race.
+#
+# A breadth first search from the goal gives the shortest path distance of
+# every open cell, computed once per maze and cached (for the last few
+# mazes) by a hash of the wall layout and goal position. Every move is then
+# a lookup of the neighbour with the lowest distance, so many bots on a large
+# maze cost one search in total instead of a search per bot per turn.
+#
+# compute_optimal_robot_logic is a drop-in replacement for
+# compute_robot_logic, for example:
+#   rr.compute_race_moves(walls, goal, bots, max_turns, logic=compute_optimal_robot_logic)
+
+import hashlib
+from collections import OrderedDict, deque
+
+# Same order and names as compute_robot_logic
+moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+move_names = {(-1, 0): 'left', (1, 0): 'right', (0, -1): 'down', (0, 1): 'up', (0, 0): 'nothing'}
+
+# Each field is a list of width * height entries (about 8 MB for a 1001x1001 maze), so
+# only the most recently used few are kept
+MAX_CACHED_FIELDS = 4
+_distance_fields = OrderedDict()
+# The maze most recently looked up, so repeated moves on one maze skip the hashing
+_last_maze = [None, None, None]
+
+
+def maze_key(walls, goal):
+    # Content hash of the wall layout and goal, bot start positions do not matter
+    digest = hashlib.sha1(walls.cells)
+    digest.update(f'{walls.width},{walls.height},{goal.x},{goal.y}'.encode())
+    return digest.hexdigest()
+
+
+def distance_field(walls, goal):
+    # Flat list of the number of moves from every cell to the goal (None if unreachable),
+    # indexed like walls.cells
+    if _last_maze[0] is walls and _last_maze[1] is goal:
+        return _last_maze[2]
+    key = maze_key(walls, goal)
+    if key in _distance_fields:
+        _distance_fields.move_to_end(key)
+    else:
+        _distance_fields[key] = _bfs_from_goal(walls, goal)
+        if len(_distance_fields) > MAX_CACHED_FIELDS:
+            _distance_fields.popitem(last=False)
+    _last_maze[:] = [walls, goal, _distance_fields[key]]
+    return _distance_fields[key]
+
+
+def clear_distance_cache():
+    _distance_fields.clear()
+    _last_maze[:] = [None, None, None]
+
+
+def _bfs_from_goal(walls, goal):
+    width, height, cells = walls.width, walls.height, walls.cells
+    dist = [None] * (width * height)
+    dist[goal.y * width + goal.x] = 0
+    queue = deque([(goal.x, goal.y)])
+    while queue:
+        x, y = queue.popleft()
+        next_dist = dist[y * width + x] + 1
+        for dx, dy in moves:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                i = ny * width + nx
+                if dist[i] is None and not cells[i]:
+                    dist[i] = next_dist
+                    queue.append((nx, ny))
+    return dist
+
+
+def compute_optimal_robot_logic(walls, goal, bot, rng=None):
+    # Moves to the neighbour closest to the goal, rng is unused and only keeps the
+    # signature the same as compute_robot_logic
+    dist = distance_field(walls, goal)
+    width, height = walls.width, walls.height
+
+    selected_move = (0, 0)
+    best = None
+    for move in moves:
+        nx, ny = bot.calc_x + move[0], bot.calc_y + move[1]
+        if 0 <= nx < width and 0 <= ny < height:
+            d = dist[ny * width + nx]
+            if d is not None and (best is None or d < best):
+                best = d
+                selected_move = move
+
+    bot.calc_x += selected_move[0]
+    bot.calc_y += selected_move[1]
+    if bot.calc_x == goal.x and bot.calc_y == goal.y:
+        bot.has_finished = True
+        return bot.name, 'finished', False
+    return bot.name, move_names[selected_move], False
@@ -0,0 +1,82 @@
+# Incremental maze renderer for the great robot race.
+#
+# update_maze_characters and print_maze rescan and rebuild the whole grid
+# for every move. MazeRenderer remembers where each bot was drawn, so after
+# a move it only recomputes the cells a bot left or entered. On a terminal
+# those cells are redrawn in place with ANSI cursor movement; otherwise the
+# whole frame is built once and sent in a single write.
+#
+# The output looks the same as print_maze, including '+' for cells shared
+# by two bots and finished bots disappearing from the maze.
+
+import sys
+
+
+class MazeRenderer:
+    def __init__(self, maze_data, bots, out=None, ansi=None):
+        self.out = out or sys.stdout
+        # Redraw in place only when writing to a terminal, unless told otherwise
+        self.ansi = self.out.isatty() if ansi is None else ansi
+        self.bots = bots
+        # The maze without any bots on it, what update_maze_characters clears cells to
+        self.background = [['_' if col.isalpha() or col == '+' else col for col in row] for row in maze_data]
+        self.frame = [row[:] for row in maze_data]
+        self.num_lines = len(maze_data) + 2
+        self.drawn_at = {}
+        self.occupants = {}
+        for i, bot in enumerate(bots):
+            if not bot.remove:
+                self.drawn_at[i] = (bot.x, bot.y)
+                self.occupants.setdefault((bot.x, bot.y), []).append(i)
+
+    def frame_text(self):
+        # Same text as print_maze
+        return ''.join(''.join(col + '  ' for col in row) + '\n' for row in self.frame) + '\n\n'
+
+    def draw(self):
+        # Writes the whole frame
+        self.out.write(self.frame_text())
+        self.out.flush()
+
+    def update(self):
+        # Brings the frame up to date with the bot positions and draws the changes
+        touched = set()
+        for i, bot in enumerate(self.bots):
+            position = None if bot.remove else (bot.x, bot.y)
+            old = self.drawn_at.get(i)
+            if position == old:
+                continue
+            if old is not None:
+                self.occupants[old].remove(i)
+                touched.add(old)
+                del self.drawn_at[i]
+            if position is not None:
+                self.occupants.setdefault(position, []).append(i)
+                touched.add(position)
+                self.drawn_at[i] = position
+
+        changed = []
+        for x, y in touched:
+            char = self.cell_char(x, y)
+            if self.frame[y][x] != char:
+                self.frame[y][x] = char
+                changed.append((x, y, char))
+
+        if self.ansi:
+            self.out.write(''.join(self.redraw_cell(x, y, char) for x, y, char in changed))
+        else:
+            self.out.write(self.frame_text())
+        self.out.flush()
+
+    def cell_char(self, x, y):
+        # Same rule as update_maze_characters: the first bot's name, '+' once a second bot
+        # joins, and the bots are applied in order
+        char = self.background[y][x]
+        for i in sorted(self.occupants.get((x, y), ())):
+            char = '+' if char.isalpha() else self.bots[i].name
+        return char
+
+    def redraw_cell(self, x, y, char):
+        # Moves the cursor up to the cell, writes it and returns to the line below the maze
+        up = self.num_lines - y
+        return f'\x1b[{up}A\x1b[{x * 3 + 1}G{char}\x1b[{up}B\r'
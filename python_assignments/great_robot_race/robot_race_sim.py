@@ -0,0 +1,132 @@
+# Headless Monte Carlo simulator for the great robot race.
+#
+# Runs many independent races of one maze at once without printing or
+# sleeping. The state of every bot in every race is kept in NumPy arrays of
+# shape (races, bots), and each turn the moves of all of them are computed
+# together with vectorized Manhattan distances and wall grid lookups.
+#
+# The bot logic is the same as compute_robot_logic: a random move, replaced
+# 45% of the time by the move closest to the goal, and on hitting a wall the
+# closest move that is not blocked (or no move at all).
+#
+# Run with: python3 robot_race_sim.py maze_data_2.csv --races 100000
+
+import argparse
+from collections import Counter, namedtuple
+from time import perf_counter
+
+import numpy as np
+
+import robot_race_functions as rr
+
+# Same order as the moves list in compute_robot_logic: left, right, down, up
+MOVES = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)])
+
+BotStats = namedtuple('BotStats', ['name', 'races', 'win_rate', 'finish_rate', 'mean_moves',
+                                   'mean_collisions', 'mean_score', 'collision_distribution'])
+
+
+def simulate_batch(wall_grid, goal, start_x, start_y, num_races, max_turns, rng):
+    # Returns the number of moves, collisions and whether each bot finished, all shaped (races, bots)
+    height, width = wall_grid.shape
+    x = np.tile(start_x, (num_races, 1))
+    y = np.tile(start_y, (num_races, 1))
+    finished = np.zeros(x.shape, dtype=bool)
+    moves = np.zeros(x.shape, dtype=np.int32)
+    collisions = np.zeros(x.shape, dtype=np.int32)
+
+    for _ in range(max_turns):
+        active = ~finished
+        if not active.any():
+            break
+
+        # Position after each of the four moves, shaped (races, bots, 4)
+        next_x = x[..., None] + MOVES[:, 0]
+        next_y = y[..., None] + MOVES[:, 1]
+        dist = np.abs(next_x - goal.x) + np.abs(next_y - goal.y)
+        # Stable sort keeps the moves list order between equal distances
+        by_dist = np.argsort(dist, axis=-1, kind='stable')
+
+        selected = rng.integers(0, 4, size=x.shape)
+        greedy = rng.random(size=x.shape) < 0.45
+        selected = np.where(greedy, by_dist[..., 0], selected)
+
+        # Cells outside the grid are not walls, same as in compute_robot_logic
+        inside = (next_x >= 0) & (next_x < width) & (next_y >= 0) & (next_y < height)
+        is_wall = inside & wall_grid[np.clip(next_y, 0, height - 1), np.clip(next_x, 0, width - 1)]
+        hit_wall = np.take_along_axis(is_wall, selected[..., None], axis=-1)[..., 0]
+
+        # On a collision take the closest move that is free, or stay put
+        free_by_dist = ~np.take_along_axis(is_wall, by_dist, axis=-1)
+        alternate = np.take_along_axis(by_dist, free_by_dist.argmax(axis=-1)[..., None], axis=-1)[..., 0]
+        step = np.where(hit_wall[..., None], MOVES[alternate], MOVES[selected])
+        step[hit_wall & ~free_by_dist.any(axis=-1)] = 0
+        step[finished] = 0
+
+        x += step[..., 0]
+        y += step[..., 1]
+        moves += active
+        collisions += hit_wall & active
+        finished |= active & (x == goal.x) & (y == goal.y)
+
+    return moves, collisions, finished
+
+
+def simulate_races(maze_data, num_races, max_turns=35, seed=None, batch_size=10000):
+    # Runs num_races independent races and returns a BotStats per bot, best mean score first
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    wall_grid = np.frombuffer(walls.cells, dtype=np.uint8).reshape(walls.height, walls.width).astype(bool)
+    start_x = np.array([bot.x for bot in bots])
+    start_y = np.array([bot.y for bot in bots])
+    rng = np.random.default_rng(seed)
+
+    all_moves, all_collisions, all_finished = [], [], []
+    for start in range(0, num_races, batch_size):
+        batch = min(batch_size, num_races - start)
+        moves, collisions, finished = simulate_batch(wall_grid, goal, start_x, start_y, batch, max_turns, rng)
+        all_moves.append(moves)
+        all_collisions.append(collisions)
+        all_finished.append(finished)
+    moves = np.concatenate(all_moves)
+    collisions = np.concatenate(all_collisions)
+    finished = np.concatenate(all_finished)
+    scores = moves + collisions
+
+    # The winner of a race has the lowest score, ties go to the first bot like print_results
+    wins = np.bincount(scores.argmin(axis=1), minlength=len(bots))
+
+    stats = []
+    for b, bot in enumerate(bots):
+        values, counts = np.unique(collisions[:, b], return_counts=True)
+        stats.append(BotStats(bot.name, num_races, wins[b] / num_races, finished[:, b].mean(),
+                              moves[:, b].mean(), collisions[:, b].mean(), scores[:, b].mean(),
+                              Counter(dict(zip(values.tolist(), counts.tolist())))))
+    stats.sort(key=lambda s: s.mean_score)
+    return stats
+
+
+def print_stats(bot_stats):
+    print("----- SIMULATION RESULTS -----")
+    print(f"{'Robot':<6} {'Win rate':>9} {'Finished':>9} {'Moves':>7} {'Collisions':>11} {'Score':>7}")
+    for s in bot_stats:
+        print(f"{s.name:<6} {s.win_rate:>9.2%} {s.finish_rate:>9.2%} {s.mean_moves:>7.2f} "
+              f"{s.mean_collisions:>11.2f} {s.mean_score:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless robot races of one maze.")
+    parser.add_argument('maze_file')
+    parser.add_argument('--races', type=int, default=10000)
+    parser.add_argument('--max-turns', type=int, default=35)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    start = perf_counter()
+    bot_stats = simulate_races(rr.read_maze(args.maze_file), args.races, args.max_turns, args.seed)
+    elapsed = perf_counter() - start
+    print_stats(bot_stats)
+    print(f"\n{args.races:,} races in {elapsed:.2f}s ({args.races / elapsed:,.0f} races/sec)")
+
+
+if __name__ == '__main__':
+    main()
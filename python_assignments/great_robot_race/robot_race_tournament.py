@@ -0,0 +1,86 @@
+# Reproducible robot race tournaments spread over all CPU cores.
+#
+# Every race gets its own random.Random seeded from the seed list, so any
+# race can be replayed on its own and the outcome does not depend on which
+# process ran it. The per-race move and collision Counters are merged in
+# seed order, so the same seeds give the same ranking at any worker count.
+#
+# Run with: python3 robot_race_tournament.py maze_data_2.csv --races 2000 --workers 4
+
+import argparse
+import random as rand
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from time import perf_counter
+
+import robot_race_functions as rr
+
+TournamentStanding = namedtuple('TournamentStanding', ['name', 'wins', 'races', 'total_moves',
+                                                       'total_collisions', 'mean_score'])
+
+
+def run_race(maze_data, seed, max_turns=35):
+    # Runs one seeded race and returns (bot names, move Counter, collision Counter)
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    robot_moves = rr.compute_race_moves(walls, goal, bots, max_turns, rand.Random(seed))
+    move_count = Counter(move[0] for move in robot_moves)
+    collision_count = Counter(move[0] for move in robot_moves if move[2] == True)
+    return [bot.name for bot in bots], move_count, collision_count
+
+
+def run_tournament(maze_data, seeds, max_turns=35, workers=None, chunksize=64):
+    # Runs one race per seed and returns the standings, most wins first
+    seeds = list(seeds)
+    if not seeds:
+        return []
+    wins = Counter()
+    move_totals = Counter()
+    collision_totals = Counter()
+    names = []
+    race = partial(run_race, maze_data, max_turns=max_turns)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # executor.map returns results in seed order whatever order the workers finish in
+        for names, move_count, collision_count in executor.map(race, seeds, chunksize=chunksize):
+            move_totals.update(move_count)
+            collision_totals.update(collision_count)
+            # Lowest score wins, ties go to the bot listed first like in print_results
+            scores = [move_count[name] + collision_count[name] for name in names]
+            wins[names[scores.index(min(scores))]] += 1
+
+    standings = []
+    for name in names:
+        total_score = move_totals[name] + collision_totals[name]
+        standings.append(TournamentStanding(name, wins[name], len(seeds), move_totals[name],
+                                            collision_totals[name], total_score / len(seeds)))
+    standings.sort(key=lambda s: (-s.wins, s.mean_score, s.name))
+    return standings
+
+
+def print_standings(standings):
+    print("----- TOURNAMENT STANDINGS -----")
+    for place, s in enumerate(standings, start=1):
+        print(str(place) + '. Robot: ' + str(s.name))
+        print('  Wins: ' + str(s.wins) + '/' + str(s.races) + ' Mean score: ' + format(s.mean_score, '.2f')
+              + ' Moves: ' + str(s.total_moves) + ' Collisions: ' + str(s.total_collisions))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a reproducible robot race tournament.")
+    parser.add_argument('maze_file')
+    parser.add_argument('--races', type=int, default=1000)
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--max-turns', type=int, default=35)
+    parser.add_argument('--workers', type=int, default=None, help="defaults to the number of CPUs")
+    args = parser.parse_args()
+
+    seeds = range(args.first_seed, args.first_seed + args.races)
+    start = perf_counter()
+    standings = run_tournament(rr.read_maze(args.maze_file), seeds, args.max_turns, args.workers)
+    elapsed = perf_counter() - start
+    print_standings(standings)
+    print(f"\n{args.races:,} races in {elapsed:.2f}s ({args.races / elapsed:,.0f} races/sec)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import csv
+import os
+import random as rand
+import tempfile
+import unittest
+
+import robot_race_binmaze as rb
+import robot_race_functions as rr
+from robot_race_mazegen import generate_maze, write_maze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def init_state(walls, goal, bots):
+    # process_maze_init results as plain values that can be compared
+    return (walls.width, walls.height, bytes(walls.cells), goal and (goal.x, goal.y),
+            [(bot.name, bot.x, bot.y) for bot in bots])
+
+
+class BinaryMazeTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        generated = os.path.join(self.tmp.name, 'generated.csv')
+        write_maze(generate_maze(41, 61, 30, seed=4, extra_openings=0.1), generated)
+        self.csv_paths = [os.path.join(HERE, name) for name in ['maze_data_1.csv', 'maze_data_2.csv',
+                                                                 'maze_data_3.csv']] + [generated]
+
+    def convert(self, csv_path):
+        path = os.path.join(self.tmp.name, os.path.basename(csv_path) + '.rrmz')
+        rb.convert_csv(csv_path, path)
+        return path
+
+    def write_csv(self, rows):
+        path = os.path.join(self.tmp.name, 'maze.csv')
+        with open(path, 'w', newline='') as f:
+            csv.writer(f).writerows(rows)
+        return path
+
+    def test_load_matches_process_maze_init(self):
+        for csv_path in self.csv_paths:
+            with self.subTest(maze=os.path.basename(csv_path)):
+                maze = rb.load(self.convert(csv_path))
+                expected = init_state(*rr.process_maze_init(rr.read_maze(csv_path)))
+                self.assertEqual(init_state(*rb.process_binary_maze_init(maze)), expected)
+                self.assertEqual(maze.grid.tobytes().decode('ascii'), ''.join(map(''.join, rr.read_maze(csv_path))))
+
+    def test_same_race(self):
+        csv_path = self.csv_paths[-1]
+        maze = rb.load(self.convert(csv_path))
+        for _ in range(2):
+            walls, goal, bots = rb.process_binary_maze_init(maze)
+            binary_moves = rr.compute_race_moves(walls, goal, bots, 50, rand.Random(1))
+            walls, goal, bots = rr.process_maze_init(rr.read_maze(csv_path))
+            self.assertEqual(binary_moves, rr.compute_race_moves(walls, goal, bots, 50, rand.Random(1)))
+
+    def test_no_goal(self):
+        maze = rb.load(self.convert(self.write_csv([['#', '#'], ['A', '_']])))
+        self.assertIsNone(maze.goal)
+        self.assertEqual(maze.bots, (('A', 0, 1),))
+
+    def test_bad_csv_leaves_no_file(self):
+        out_path = os.path.join(self.tmp.name, 'bad.rrmz')
+        for rows in [[['#', '#'], ['#']], [['#', '', 'AB', '$']], [['#', 'é']]]:
+            with self.subTest(rows=rows):
+                self.assertRaises(ValueError, rb.convert_csv, self.write_csv(rows), out_path)
+                self.assertFalse(os.path.exists(out_path))
+                self.assertFalse(os.path.exists(out_path + '.tmp'))
+
+    def test_not_a_maze_file(self):
+        path = os.path.join(self.tmp.name, 'other.rrmz')
+        with open(path, 'wb') as f:
+            f.write(b'\0' * rb.HEADER.size)
+        self.assertRaises(ValueError, rb.load, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import random as rand
+import tempfile
+import unittest
+
+import robot_race_functions as rr
+import robot_race_movelog as ml
+from robot_race_mazegen import MAX_BOTS, generate_maze
+
+
+def race_moves(seed):
+    walls, goal, bots = rr.process_maze_init(generate_maze(21, 21, MAX_BOTS, seed=seed, extra_openings=0.3))
+    return list(rr.iter_race_moves(walls, goal, bots, 100, rand.Random(seed)))
+
+
+class MoveLogTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        # Every direction code, 'nothing' and 'finished' included, whatever the race produced
+        self.moves = race_moves(0) + [('z', direction, True) for direction in ml.DIRECTIONS]
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_round_trip(self):
+        for name in ['race.ndjson', 'race.moves']:
+            with self.subTest(name=name):
+                ml.write_moves(iter(self.moves), self.path(name))
+                self.assertEqual(list(ml.read_moves(self.path(name))), self.moves)
+
+    def test_binary_reads_across_buffers(self):
+        ml.write_moves(self.moves, self.path('race.moves'))
+        self.assertEqual(os.path.getsize(self.path('race.moves')), len(ml.MAGIC) + 3 * len(self.moves))
+        for buffer_size in [1, 2, 4, 5, 3000]:
+            with self.subTest(buffer_size=buffer_size):
+                self.assertEqual(list(ml.read_moves(self.path('race.moves'), buffer_size)), self.moves)
+
+    def test_logged_moves_passes_moves_on(self):
+        for name in ['race.ndjson', 'race.moves']:
+            with self.subTest(name=name):
+                passed = rr.score_moves(ml.logged_moves(iter(self.moves), self.path(name)))
+                self.assertEqual(passed, rr.score_moves(self.moves))
+                self.assertEqual(rr.score_moves(ml.read_moves(self.path(name))), passed)
+
+    def test_empty_race(self):
+        for name in ['race.ndjson', 'race.moves']:
+            with self.subTest(name=name):
+                ml.write_moves([], self.path(name))
+                self.assertEqual(list(ml.read_moves(self.path(name))), [])
+
+    def test_not_a_move_log(self):
+        with open(self.path('other.moves'), 'wb') as f:
+            f.write(b'RRMZ')
+        self.assertRaises(ValueError, list, ml.read_moves(self.path('other.moves')))
+
+
+if __name__ == '__main__':
+    unittest.main()
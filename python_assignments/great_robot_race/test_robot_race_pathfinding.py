@@ -0,0 +1,101 @@
+import os
+import unittest
+
+import robot_race_functions as rr
+import robot_race_pathfinding as rp
+from robot_race_mazegen import generate_maze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def relaxed_distances(walls, goal):
+    # Shortest distances by relaxing every cell until nothing changes, slow but obviously right
+    width, height = walls.width, walls.height
+    dist = {(goal.x, goal.y): 0}
+    changed = True
+    while changed:
+        changed = False
+        for y in range(height):
+            for x in range(width):
+                if (x, y) in walls:
+                    continue
+                near = [dist[(x + dx, y + dy)] for dx, dy in rp.moves if (x + dx, y + dy) in dist]
+                if near and dist.get((x, y), min(near) + 2) > min(near) + 1:
+                    dist[(x, y)] = min(near) + 1
+                    changed = True
+    return [dist.get((i % width, i // width)) for i in range(width * height)]
+
+
+class DistanceFieldTests(unittest.TestCase):
+    def setUp(self):
+        rp.clear_distance_cache()
+
+    def tearDown(self):
+        rp.clear_distance_cache()
+
+    def test_small_maze(self):
+        walls, goal, _ = rr.process_maze_init([list('#####'),
+                                               list('#_#$#'),
+                                               list('#___#'),
+                                               list('##_##')])
+        self.assertEqual(rp.distance_field(walls, goal), [None, None, None, None, None,
+                                                          None, 4, None, 0, None,
+                                                          None, 3, 2, 1, None,
+                                                          None, None, 3, None, None])
+
+    def test_matches_relaxed_distances(self):
+        mazes = [rr.read_maze(os.path.join(HERE, name)) for name in ['maze_data_1.csv', 'maze_data_2.csv',
+                                                                      'maze_data_3.csv']]
+        mazes.append(generate_maze(21, 31, 5, seed=3, extra_openings=0.2))
+        for i, maze_data in enumerate(mazes):
+            with self.subTest(maze=i):
+                walls, goal, _ = rr.process_maze_init(maze_data)
+                self.assertEqual(rp.distance_field(walls, goal), relaxed_distances(walls, goal))
+
+    def test_optimal_bots_take_the_shortest_path(self):
+        maze_data = generate_maze(31, 31, 10, seed=1)
+        walls, goal, bots = rr.process_maze_init(maze_data)
+        dist = rp.distance_field(walls, goal)
+        shortest = {bot.name: dist[bot.y * walls.width + bot.x] for bot in bots}
+        robot_moves = rr.compute_race_moves(walls, goal, bots, 10_000, logic=rp.compute_optimal_robot_logic)
+        move_count, collision_count = rr.score_moves(robot_moves)
+        self.assertTrue(rr.is_race_over(bots))
+        self.assertEqual(dict(move_count), shortest)
+        self.assertEqual(collision_count, {})
+
+
+class DistanceCacheTests(unittest.TestCase):
+    def setUp(self):
+        rp.clear_distance_cache()
+        self.mazes = [rr.process_maze_init(generate_maze(11, 11, 1, seed=seed))[:2]
+                      for seed in range(rp.MAX_CACHED_FIELDS + 1)]
+
+    def tearDown(self):
+        rp.clear_distance_cache()
+
+    def test_same_layout_shares_a_field(self):
+        walls, goal = self.mazes[0]
+        field = rp.distance_field(walls, goal)
+        copy = rr.WallGrid(walls.width, walls.height, bytearray(walls.cells))
+        self.assertIs(rp.distance_field(copy, rr.Goal(goal.x, goal.y)), field)
+        self.assertEqual(len(rp._distance_fields), 1)
+
+    def test_least_recently_used_field_is_dropped(self):
+        fields = [rp.distance_field(walls, goal) for walls, goal in self.mazes[:rp.MAX_CACHED_FIELDS]]
+        # Using the first maze again makes the second one the oldest
+        rp.distance_field(*self.mazes[0])
+        rp.distance_field(*self.mazes[-1])
+        self.assertEqual(len(rp._distance_fields), rp.MAX_CACHED_FIELDS)
+        self.assertNotIn(rp.maze_key(*self.mazes[1]), rp._distance_fields)
+        self.assertIs(rp.distance_field(*self.mazes[0]), fields[0])
+        self.assertIsNot(rp.distance_field(*self.mazes[1]), fields[1])
+
+    def test_clear(self):
+        rp.distance_field(*self.mazes[0])
+        rp.clear_distance_cache()
+        self.assertEqual(len(rp._distance_fields), 0)
+        self.assertEqual(rp._last_maze, [None, None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
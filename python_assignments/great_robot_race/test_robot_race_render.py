@@ -0,0 +1,79 @@
+import contextlib
+import io
+import os
+import random as rand
+import unittest
+
+import robot_race_functions as rr
+from robot_race_mazegen import generate_maze
+from robot_race_render import MazeRenderer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def baseline_frames(maze_data, seed, max_turns):
+    # Every frame the original loop prints, with update_maze_characters and print_maze
+    maze_chars = [row[:] for row in maze_data]
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    bot_data = {bot.name: bot for bot in bots}
+    frames = []
+    for bot_name, direction, _ in rr.iter_race_moves(walls, goal, bots, max_turns, rand.Random(seed)):
+        bot_data[bot_name].process_move(direction)
+        rr.update_maze_characters(maze_chars, bots)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rr.print_maze(maze_chars)
+        frames.append(out.getvalue())
+    return frames
+
+
+def rendered_frames(maze_data, seed, max_turns, ansi=False):
+    # Every frame MazeRenderer writes for the same race, and the renderer
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    bot_data = {bot.name: bot for bot in bots}
+    out = io.StringIO()
+    renderer = MazeRenderer(maze_data, bots, out, ansi=ansi)
+    frames = []
+    for bot_name, direction, _ in rr.iter_race_moves(walls, goal, bots, max_turns, rand.Random(seed)):
+        bot_data[bot_name].process_move(direction)
+        start = out.tell()
+        renderer.update()
+        frames.append(out.getvalue()[start:])
+    return frames, renderer
+
+
+class MazeRendererTests(unittest.TestCase):
+    def setUp(self):
+        self.mazes = [rr.read_maze(os.path.join(HERE, name)) for name in ['maze_data_1.csv', 'maze_data_2.csv',
+                                                                           'maze_data_3.csv']]
+        # Lots of bots in a small open maze, so they often share a cell and are drawn as '+'
+        self.mazes.append(generate_maze(9, 9, 20, seed=2, extra_openings=1.0))
+
+    def test_frames_match_print_maze(self):
+        for i, maze_data in enumerate(self.mazes):
+            for seed in range(3):
+                with self.subTest(maze=i, seed=seed):
+                    frames, _ = rendered_frames(maze_data, seed, 35)
+                    self.assertEqual(frames, baseline_frames(maze_data, seed, 35))
+
+    def test_shared_cells(self):
+        frames, _ = rendered_frames(self.mazes[-1], 0, 35)
+        self.assertTrue(any('+' in frame for frame in frames))
+
+    def test_ansi_keeps_the_same_frame(self):
+        for i, maze_data in enumerate(self.mazes):
+            with self.subTest(maze=i):
+                _, renderer = rendered_frames(maze_data, 0, 35, ansi=True)
+                self.assertEqual(renderer.frame_text(), baseline_frames(maze_data, 0, 35)[-1])
+
+    def test_draw(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rr.print_maze(self.mazes[0])
+        renderer_out = io.StringIO()
+        MazeRenderer(self.mazes[0], rr.process_maze_init(self.mazes[0])[2], renderer_out).draw()
+        self.assertEqual(renderer_out.getvalue(), out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
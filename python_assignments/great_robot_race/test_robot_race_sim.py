@@ -0,0 +1,87 @@
+import os
+import unittest
+
+import numpy as np
+
+import robot_race_functions as rr
+import robot_race_sim as sim
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class RecordingRng:
+    # Wraps a NumPy Generator and keeps every array simulate_batch draws
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+        self.selected = []
+        self.greedy = []
+
+    def integers(self, *args, **kwargs):
+        self.selected.append(self.rng.integers(*args, **kwargs))
+        return self.selected[-1]
+
+    def random(self, *args, **kwargs):
+        self.greedy.append(self.rng.random(*args, **kwargs))
+        return self.greedy[-1]
+
+
+class DrawRng:
+    # Gives compute_robot_logic the draws one bot got in the simulator
+    def __init__(self, selected, greedy):
+        self.selected = int(selected)
+        self.greedy = float(greedy)
+
+    def randint(self, a, b):
+        return self.selected
+
+    def random(self):
+        return self.greedy
+
+
+def replay_race(maze_data, rng, race, max_turns):
+    # Plays one race of the batch with compute_robot_logic, turn by turn like iter_race_moves
+    walls, goal, bots = rr.process_maze_init(maze_data)
+    robot_moves = []
+    turn = 0
+    while not rr.is_race_over(bots) and turn < max_turns:
+        for b, bot in enumerate(bots):
+            if not bot.has_finished:
+                draws = DrawRng(rng.selected[turn][race, b], rng.greedy[turn][race, b])
+                robot_moves.append(rr.compute_robot_logic(walls, goal, bot, draws))
+        turn += 1
+    move_count, collision_count = rr.score_moves(robot_moves)
+    return ([move_count[bot.name] for bot in bots], [collision_count[bot.name] for bot in bots],
+            [bot.has_finished for bot in bots])
+
+
+class SimulatorTests(unittest.TestCase):
+    def test_batch_matches_compute_robot_logic(self):
+        maze_data = rr.read_maze(os.path.join(HERE, 'maze_data_1.csv'))
+        walls, goal, bots = rr.process_maze_init(maze_data)
+        wall_grid = np.frombuffer(walls.cells, dtype=np.uint8).reshape(walls.height, walls.width).astype(bool)
+        start_x = np.array([bot.x for bot in bots])
+        start_y = np.array([bot.y for bot in bots])
+        num_races, max_turns = 50, 35
+        rng = RecordingRng(0)
+        moves, collisions, finished = sim.simulate_batch(wall_grid, goal, start_x, start_y, num_races, max_turns, rng)
+
+        for race in range(num_races):
+            with self.subTest(race=race):
+                self.assertEqual(replay_race(maze_data, rng, race, max_turns),
+                                 (moves[race].tolist(), collisions[race].tolist(), finished[race].tolist()))
+
+    def test_simulate_races(self):
+        maze_data = rr.read_maze(os.path.join(HERE, 'maze_data_1.csv'))
+        stats = sim.simulate_races(maze_data, 1000, seed=0, batch_size=300)
+        self.assertEqual(sorted(s.name for s in stats), ['A', 'B', 'C'])
+        self.assertEqual([s.mean_score for s in stats], sorted(s.mean_score for s in stats))
+        self.assertAlmostEqual(sum(s.win_rate for s in stats), 1)
+        for s in stats:
+            self.assertEqual(s.races, 1000)
+            self.assertEqual(sum(s.collision_distribution.values()), 1000)
+            self.assertAlmostEqual(s.mean_score, s.mean_moves + s.mean_collisions)
+        self.assertEqual(sim.simulate_races(maze_data, 1000, seed=0, batch_size=300), stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import random as rand
+import unittest
+
+import robot_race_functions as rr
+import robot_race_tournament as rt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class TournamentTests(unittest.TestCase):
+    def setUp(self):
+        self.maze_data = rr.read_maze(os.path.join(HERE, 'maze_data_2.csv'))
+
+    def test_same_standings_at_any_worker_count(self):
+        seeds = range(60)
+        standings = rt.run_tournament(self.maze_data, seeds, workers=1)
+        for workers, chunksize in [(2, 1), (4, 7)]:
+            with self.subTest(workers=workers, chunksize=chunksize):
+                self.assertEqual(rt.run_tournament(self.maze_data, seeds, workers=workers, chunksize=chunksize),
+                                 standings)
+        self.assertEqual(sum(s.wins for s in standings), 60)
+
+    def test_run_race_replays_a_seed(self):
+        names, move_count, collision_count = rt.run_race(self.maze_data, 7)
+        walls, goal, bots = rr.process_maze_init(self.maze_data)
+        expected_moves, expected_collisions = rr.score_moves(
+            rr.iter_race_moves(walls, goal, bots, 35, rand.Random(7)))
+        self.assertEqual(names, [bot.name for bot in bots])
+        self.assertEqual((move_count, collision_count), (expected_moves, expected_collisions))
+
+    def test_no_seeds(self):
+        self.assertEqual(rt.run_tournament(self.maze_data, []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# Compares the exact fixed-point pricing in fixed_point.py with the float
+# path in rate_tables.py.
+#
+# Both price the same random weights (whole milli-pounds, so the inputs are
+# identical) and the time of each is printed with the slowdown of the exact
+# path. It then counts how many float quotes round to a different cent than
+# the exact ones, which is the drift the fixed-point path avoids.
+#
+# Run with: python3 benchmark_fixed_point.py --packages 10000000
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+import fixed_point as fp
+import rate_tables as rt
+
+
+def best_time(function, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function()
+        times.append(perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time exact integer pricing against float pricing.")
+    parser.add_argument("--packages", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    milli = np.random.default_rng(0).integers(0, 40 * fp.WEIGHT_SCALE, args.packages, dtype=np.int64)
+    weights = milli / fp.WEIGHT_SCALE
+
+    float_time, (float_methods, float_costs) = best_time(lambda: rt.cheapest(weights))
+    fixed_time, (fixed_methods, millicents) = best_time(lambda: fp.cheapest(milli))
+    print(f"{'path':<8} {'seconds':>8} {'packages/sec':>14}")
+    print(f"{'float':<8} {float_time:>8.3f} {args.packages / float_time:>14,.0f}")
+    print(f"{'fixed':<8} {fixed_time:>8.3f} {args.packages / fixed_time:>14,.0f}")
+    print(f"fixed point is {fixed_time / float_time:.2f}x the float time")
+
+    cents = fp.to_cents(millicents)
+    # Half up like to_cents, so only the float error itself makes a difference
+    float_cents = np.floor(float_costs * fp.MONEY_SCALE + 0.5).astype(np.int64)
+    drift = float_cents != cents
+    print(f"\n{int((float_methods != fixed_methods).sum()):,} packages got a different method")
+    print(f"{int(drift.sum()):,} float quotes rounded to a different cent than the exact cost")
+    for i in np.flatnonzero(drift)[:5].tolist():
+        print("  {:.3f} lb: float {!r} -> {}, exact {} millicents -> {}".format(
+            weights[i], float(float_costs[i]), *fp.format_cents([float_cents[i]]), millicents[i],
+            *fp.format_cents([cents[i]])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Load test for shipping_server.py, batched against per-call pricing.
+#
+# Starts the server twice in a subprocess on a free local port, once with
+# micro-batching and once with --no-batching (every request priced with its
+# own cheapest_shipping call), and hammers it from many keep-alive client
+# connections. Prints requests/sec from the client side and the latency and
+# batch size metrics the server reports at /metrics. The plain in-process
+# cheapest_shipping call rate is printed first for reference.
+#
+# Run with: python3 benchmark_server.py --connections 200 --requests 50
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+from time import perf_counter, sleep
+
+from shipping_calc import cheapest_shipping
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, extra_args):
+    server = subprocess.Popen([sys.executable, os.path.join(HERE, "shipping_server.py"), "--port", str(port)]
+                              + extra_args, stdout=subprocess.DEVNULL)
+    # Wait until the server accepts connections
+    for _ in range(200):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server
+        except OSError:
+            sleep(0.05)
+    server.kill()
+    raise RuntimeError("shipping_server.py did not start")
+
+
+async def get(reader, writer, target):
+    writer.write("GET {} HTTP/1.1\r\nHost: localhost\r\n\r\n".format(target).encode())
+    await writer.drain()
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b""):
+            break
+        if header.lower().startswith(b"content-length:"):
+            length = int(header.split(b":")[1])
+    return json.loads(await reader.readexactly(length))
+
+
+async def client(reader, writer, weights):
+    for weight in weights:
+        await get(reader, writer, "/quote?weight={}".format(weight))
+    writer.close()
+
+
+async def load(port, connections, requests):
+    rng = random.Random(0)
+    # Connections are opened before the clock starts so only the requests are timed
+    streams = [await asyncio.open_connection("127.0.0.1", port) for _ in range(connections)]
+    start = perf_counter()
+    await asyncio.gather(*(client(reader, writer, [round(rng.uniform(0, 40), 2) for _ in range(requests)])
+                           for reader, writer in streams))
+    elapsed = perf_counter() - start
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    metrics = await get(reader, writer, "/metrics")
+    writer.close()
+    return connections * requests / elapsed, metrics
+
+
+def run(label, connections, requests, extra_args):
+    port = free_port()
+    server = start_server(port, extra_args)
+    try:
+        rate, metrics = asyncio.run(load(port, connections, requests))
+    finally:
+        server.terminate()
+        server.wait()
+    latency, batches = metrics["latency_ms"], metrics["batch_size"]
+    mean_batch = "{:.1f}".format(batches["mean"]) if batches["mean"] else "-"
+    print(f"{label:<12} {rate:>10,.0f} {latency['p50']:>9.3f} {latency['p99']:>9.3f} {mean_batch:>11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test shipping_server.py with and without batching.")
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50, help="requests sent on each connection")
+    parser.add_argument("--max-delay-ms", type=float, default=0.2)
+    args = parser.parse_args()
+
+    calls = 200_000
+    start = perf_counter()
+    for i in range(calls):
+        cheapest_shipping(i % 40)
+    print(f"cheapest_shipping in process: {calls / (perf_counter() - start):,.0f} calls/sec\n")
+
+    print(f"{'server':<12} {'req/sec':>10} {'p50 ms':>9} {'p99 ms':>9} {'mean batch':>11}")
+    run("per-call", args.connections, args.requests, ["--no-batching"])
+    run("batched", args.connections, args.requests, ["--max-delay-ms", str(args.max_delay_ms)])
+
+
+if __name__ == "__main__":
+    main()
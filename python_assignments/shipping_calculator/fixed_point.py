@@ -0,0 +1,142 @@
+# Exact shipping prices with scaled integers instead of floats.
+#
+# Floats can't store most cent amounts exactly (4.1 * 4.75 + 20 is
+# 39.474999999999994, not 39.475), so rounding a float cost can go the wrong
+# way. Here weights are whole milli-pounds and rates whole cents, both NumPy
+# int64, and
+#
+#     weight (milli-lb) * rate (cents per lb) + flat rate (cents) * 1000
+#
+# is the exact cost in millicents (1/1000 of a cent). Costs are compared in
+# millicents, so ties between methods are real ties, and only rounded to
+# whole cents (half up) at the end. There is no Decimal object per package,
+# Decimal is only used to convert the handful of numbers in a rate table.
+#
+# Run with: python3 fixed_point.py 4.1 4.125 12   (prints exact quotes)
+
+import argparse
+from collections import namedtuple
+from decimal import Decimal
+
+import numpy as np
+
+import rate_tables as rt
+
+WEIGHT_SCALE = 1000  # milli-pounds per lb
+MONEY_SCALE = 100  # cents per dollar
+INT64_MAX = np.iinfo(np.int64).max
+
+# Same fields as rate_tables.RateTable, scaled to milli-lb, cents per lb and cents
+FixedRateTable = namedtuple("FixedRateTable", ["breakpoints", "rates", "flat_rate"])
+
+
+# Exact integer value of number * scale, or a ValueError if it needs more precision
+def _scaled(number, scale):
+    value = Decimal(str(number)) * scale
+    if value != value.to_integral_value():
+        raise ValueError(f"{number} has more precision than 1/{scale}")
+    return int(value)
+
+
+def to_fixed(table):
+    # Converts a rate_tables.RateTable
+    return FixedRateTable(np.array([_scaled(b, WEIGHT_SCALE) for b in table.breakpoints], dtype=np.int64),
+                          np.array([_scaled(r, MONEY_SCALE) for r in table.rates], dtype=np.int64),
+                          _scaled(table.flat_rate, MONEY_SCALE))
+
+
+DEFAULT_TABLES = tuple(to_fixed(table) for table in rt.DEFAULT_TABLES)
+
+
+# Float weights in lb to milli-lb, rounded to the nearest milli-lb
+def weights_from_float(weights):
+    return np.rint(np.asarray(weights, dtype=float) * WEIGHT_SCALE).astype(np.int64)
+
+
+# Decimal strings like "4.125" to milli-lb, exactly and without float or Decimal
+def weights_from_str(weights):
+    weights = np.asarray(weights, dtype=str)
+    if weights.size == 0:
+        return np.zeros(weights.shape, dtype=np.int64)
+    whole, _, fraction = np.char.partition(weights, ".").T
+    negative = np.char.startswith(whole, "-")
+    digits = np.char.lstrip(whole, "-")
+    # One optional minus sign, then digits on at least one side of the point
+    valid = ((np.char.str_len(whole) - np.char.str_len(digits) == negative)
+             & (np.char.isdigit(digits) | (np.char.str_len(digits) == 0))
+             & (np.char.isdigit(fraction) | (np.char.str_len(fraction) == 0))
+             & (np.char.str_len(digits) + np.char.str_len(fraction) > 0))
+    if not valid.all():
+        raise ValueError(f"{weights[~valid][0]!r} is not a weight")
+    if (np.char.str_len(np.char.rstrip(fraction, "0")) > 3).any():
+        raise ValueError("weights can have at most 3 decimal places")
+    fraction = np.char.ljust(np.char.rstrip(fraction, "0"), 3, "0")
+    whole = np.where(np.char.str_len(digits) == 0, "0", digits)
+    milli = whole.astype(np.int64) * WEIGHT_SCALE + fraction.astype(np.int64)
+    return np.where(negative, -milli, milli)
+
+
+def _check_range(weights, tables):
+    # weight * rate + flat must fit in an int64
+    if weights.size == 0:
+        return
+    heaviest = int(np.abs(weights).max())
+    for table in tables:
+        if heaviest * int(np.abs(table.rates).max()) + abs(table.flat_rate) * WEIGHT_SCALE > INT64_MAX:
+            raise OverflowError(f"weight of {heaviest} milli-lb is too large to price exactly")
+
+
+# Exact cost in millicents of every weight (milli-lb) for one fixed rate table
+def price(table, weights):
+    weights = np.atleast_1d(np.asarray(weights, dtype=np.int64))
+    _check_range(weights, (table,))
+    return _price(table, weights)
+
+
+def _price(table, weights):
+    tiers = np.searchsorted(table.breakpoints, weights, side="left")
+    return weights * table.rates[tiers] + table.flat_rate * WEIGHT_SCALE
+
+
+# Index of the cheapest method and its exact cost in millicents for every weight,
+# with the same tie rules as rate_tables.cheapest
+def cheapest(weights, tables=DEFAULT_TABLES):
+    weights = np.atleast_1d(np.asarray(weights, dtype=np.int64))
+    _check_range(weights, tables)
+    costs = np.stack([_price(table, weights) for table in tables])
+    best = costs.argmin(axis=0)
+    lowest = np.take_along_axis(costs, best[None, :], axis=0)
+    unique = (costs == lowest).sum(axis=0) == 1
+    methods = np.where(unique, best, len(tables) - 1)
+    return methods, np.take_along_axis(costs, methods[None, :], axis=0)[0]
+
+
+# Millicents to whole cents, rounding halves away from zero
+def to_cents(millicents):
+    millicents = np.asarray(millicents, dtype=np.int64)
+    cents = (np.abs(millicents) + WEIGHT_SCALE // 2) // WEIGHT_SCALE
+    return np.where(millicents < 0, -cents, cents)
+
+
+# Whole cents as "$12.34" strings
+def format_cents(cents):
+    return ["{}${}.{:02d}".format("-" if c < 0 else "", abs(c) // 100, abs(c) % 100)
+            for c in np.asarray(cents).tolist()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print exact cheapest shipping quotes.")
+    parser.add_argument("weights", nargs="+", help="weights in lb, up to 3 decimal places")
+    parser.add_argument("--config", help="JSON rate config, defaults to the rates in shipping_calc.py")
+    args = parser.parse_args()
+
+    tables = tuple(to_fixed(t) for t in rt.load_tables(args.config)) if args.config else DEFAULT_TABLES
+    weights = weights_from_str(args.weights)
+    methods, millicents = cheapest(weights, tables)
+    for weight, method, exact, cost in zip(args.weights, methods.tolist(), millicents.tolist(),
+                                           format_cents(to_cents(millicents))):
+        print("{:>10} lb  {:<24} {:>12}  ({} millicents)".format(weight, rt.METHOD_NAMES[method], cost, exact))
+
+
+if __name__ == "__main__":
+    main()
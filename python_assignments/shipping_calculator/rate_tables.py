@@ -0,0 +1,77 @@
+# Data driven shipping rates that price whole NumPy arrays of weights at once.
+#
+# A rate table is a list of tier breakpoints, the cost per lb for each tier
+# and a flat rate. A weight falls in the first tier whose breakpoint it does
+# not go over, just like the if/elif chains in shipping_calc.py, and
+# np.searchsorted finds the tier of every weight in one call.
+
+import json
+from collections import namedtuple
+
+import numpy as np
+
+# breakpoints are the (inclusive) upper weights of each tier, rates has one more
+# entry than breakpoints for weights above the last breakpoint
+RateTable = namedtuple("RateTable", ["breakpoints", "rates", "flat_rate"])
+
+# The rates used in shipping_calc.py
+GROUND = RateTable(breakpoints=(2, 6, 10), rates=(1.5, 3, 4, 4.75), flat_rate=20)
+DRONE = RateTable(breakpoints=(2, 6, 10), rates=(4.5, 9, 12, 14.25), flat_rate=0)
+PREMIUM_GROUND = RateTable(breakpoints=(), rates=(0,), flat_rate=125)
+
+# Methods in the order cheapest_shipping compares them. The last one is the fallback
+# that wins whenever no other method is strictly the cheapest
+METHOD_NAMES = ("Ground Shipping", "Drone Shipping", "Premium Ground Shipping")
+DEFAULT_TABLES = (GROUND, DRONE, PREMIUM_GROUND)
+# Names of the methods in a JSON rate config, in the same order
+CONFIG_KEYS = ("ground", "drone", "premium_ground")
+
+
+# Cost of every weight in an array for one rate table
+def price(table, weights):
+    weights = np.atleast_1d(np.asarray(weights, dtype=float))
+    tiers = np.searchsorted(np.asarray(table.breakpoints, dtype=float), weights, side="left")
+    rates = np.asarray(table.rates, dtype=float)[tiers]
+    # A zero rate means a flat cost, even for an infinite weight (0 * inf would be NaN)
+    with np.errstate(invalid="ignore"):
+        return np.where(rates == 0, 0.0, weights * rates) + table.flat_rate
+
+
+# Cost of every weight with every method, shaped (methods, weights)
+def price_all(weights, tables=DEFAULT_TABLES):
+    return np.stack([price(table, weights) for table in tables])
+
+
+# Index of the cheapest method and its cost for every weight, with the same tie
+# rules as cheapest_shipping: a method only wins when it is strictly cheaper than
+# all the others, otherwise the last method is chosen
+def cheapest(weights, tables=DEFAULT_TABLES):
+    costs = price_all(weights, tables)
+    best = costs.argmin(axis=0)
+    lowest = np.take_along_axis(costs, best[None, :], axis=0)
+    unique = (costs == lowest).sum(axis=0) == 1
+    methods = np.where(unique, best, len(tables) - 1)
+    return methods, np.take_along_axis(costs, methods[None, :], axis=0)[0]
+
+
+# Same as cheapest but with the method names, like cheapest_shipping returns
+def cheapest_names(weights, tables=DEFAULT_TABLES, names=METHOD_NAMES):
+    methods, costs = cheapest(weights, tables)
+    return np.asarray(names)[methods], costs
+
+
+# Rate tables in method order from a JSON config file shaped like rates.json:
+# {"ground": {"breakpoints": [...], "rates": [...], "flat_rate": 20}, "drone": {...}, "premium_ground": {...}}
+def load_tables(path):
+    with open(path, "r") as f:
+        config = json.load(f)
+    tables = []
+    for key in CONFIG_KEYS:
+        entry = config[key]
+        table = RateTable(tuple(entry.get("breakpoints", ())), tuple(entry["rates"]), entry.get("flat_rate", 0))
+        if len(table.rates) != len(table.breakpoints) + 1:
+            raise ValueError(f"{key} needs exactly one more rate than breakpoints")
+        if list(table.breakpoints) != sorted(table.breakpoints):
+            raise ValueError(f"{key} breakpoints must be in increasing order")
+        tables.append(table)
+    return tuple(tables)
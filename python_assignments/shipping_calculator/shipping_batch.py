@@ -0,0 +1,170 @@
+# Batch shipping quotes for a whole manifest of packages.
+#
+# Reads the rate tiers once from a JSON config (see rates.json), then streams
+# the manifest in fixed size chunks, prices every chunk with one vectorized
+# rate_tables.cheapest call and appends the quotes to the output file. Only
+# one chunk is in memory at a time, so manifests of tens of millions of rows
+# are fine. The throughput is printed when the run finishes.
+#
+# The manifest can be a CSV file with a header row, or a Parquet file (which
+# needs pyarrow installed). Every input column is kept and "method" and
+# "cost" columns are added. Blank CSV lines are skipped. Any other row
+# without a non-negative number for its weight stops the run with a
+# ValueError naming the row (counted from 1 after the CSV header), and the
+# quotes are written to a temporary file that only replaces the output once
+# every row is priced, so a bad manifest never leaves half a quote file.
+#
+# Usage:
+#   python3 shipping_batch.py manifest.csv quotes.csv --config rates.json
+#   python3 shipping_batch.py manifest.parquet quotes.parquet --weight-column weight_lb
+
+import argparse
+import csv
+import os
+import sys
+from itertools import islice
+from time import perf_counter
+
+import numpy as np
+
+import rate_tables as rt
+
+CHUNK_SIZE = 100_000
+
+
+def is_parquet(path):
+    return path.endswith(".parquet")
+
+
+# Raises a ValueError for the first weight that is not a non-negative number,
+# row_numbers gives the manifest row of every weight
+def check_weights(weights, row_numbers):
+    bad = ~(np.isfinite(weights) & (weights >= 0))
+    if bad.any():
+        i = int(bad.argmax())
+        raise ValueError("row {}: weight {} is not a non-negative number".format(row_numbers[i], weights[i]))
+
+
+# Yields (rows, weights) for each chunk of CSV rows left in reader
+def read_csv_chunks(reader, weight_index, chunk_size):
+    first = 1
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            break
+        row_numbers = range(first, first + len(rows))
+        first += len(rows)
+        try:
+            weights = np.array([row[weight_index] for row in rows], dtype=float)
+        except (IndexError, ValueError):
+            # Only chunks with a blank line or a bad row take the slow path
+            rows, row_numbers = _checked_rows(rows, row_numbers, weight_index)
+            if not rows:
+                continue
+            weights = np.array([row[weight_index] for row in rows], dtype=float)
+        check_weights(weights, row_numbers)
+        yield rows, weights
+
+
+# Drops blank lines and raises a ValueError for the first row without a number for its weight
+def _checked_rows(rows, row_numbers, weight_index):
+    kept, kept_numbers = [], []
+    for row, number in zip(rows, row_numbers):
+        if not any(field.strip() for field in row):
+            continue
+        if len(row) <= weight_index:
+            raise ValueError("row {}: has {} columns, the weight is column {}".format(
+                number, len(row), weight_index + 1))
+        try:
+            float(row[weight_index])
+        except ValueError:
+            raise ValueError("row {}: weight {!r} is not a number".format(number, row[weight_index])) from None
+        kept.append(row)
+        kept_numbers.append(number)
+    return kept, kept_numbers
+
+
+def quote_csv(src, dst, tables, weight_column, chunk_size):
+    total = 0
+    with open(src, "r", newline="") as f, open(dst, "w", newline="") as out:
+        reader = csv.reader(f)
+        writer = csv.writer(out)
+        header = next(reader)
+        weight_index = header.index(weight_column)
+        # The header goes out first, so a manifest without packages still gives a valid file
+        writer.writerow(header + ["method", "cost"])
+        for rows, weights in read_csv_chunks(reader, weight_index, chunk_size):
+            methods, costs = rt.cheapest(weights, tables)
+            # Plain Python values are much faster for the csv writer than NumPy scalars
+            for row, method, cost in zip(rows, methods.tolist(), costs.tolist()):
+                row.append(rt.METHOD_NAMES[method])
+                row.append("%.2f" % cost)
+            writer.writerows(rows)
+            total += len(rows)
+    return total
+
+
+def quote_parquet(src, dst, tables, weight_column, chunk_size):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet manifests need pyarrow: pip install pyarrow")
+
+    total = 0
+    manifest = pq.ParquetFile(src)
+    schema = manifest.schema_arrow.append(pa.field("method", pa.string())).append(pa.field("cost", pa.float64()))
+    # Opened before the first batch, so a manifest without packages still gives a file with the schema
+    with pq.ParquetWriter(dst, schema) as writer:
+        for batch in manifest.iter_batches(batch_size=chunk_size):
+            column = batch.column(weight_column)
+            row_numbers = range(total + 1, total + batch.num_rows + 1)
+            if column.null_count:
+                i = int(np.flatnonzero(column.is_null().to_numpy(zero_copy_only=False))[0])
+                raise ValueError("row {}: weight is missing".format(row_numbers[i]))
+            weights = column.to_numpy(zero_copy_only=False).astype(float)
+            check_weights(weights, row_numbers)
+            methods, costs = rt.cheapest(weights, tables)
+            names = np.asarray(rt.METHOD_NAMES)[methods]
+            table = pa.Table.from_batches([batch]).append_column(
+                "method", pa.array(names, type=pa.string())).append_column(
+                "cost", pa.array(np.round(costs, 2), type=pa.float64()))
+            writer.write_table(table)
+            total += batch.num_rows
+    return total
+
+
+def quote_manifest(src, dst, tables=rt.DEFAULT_TABLES, weight_column="weight", chunk_size=CHUNK_SIZE):
+    # Writes quotes for every package in src to dst and returns the number of packages.
+    # The quotes go to a file next to dst first and are only renamed into place once
+    # every row is priced
+    quote = quote_parquet if is_parquet(src) else quote_csv
+    tmp_path = dst + ".tmp"
+    try:
+        total = quote(src, tmp_path, tables, weight_column, chunk_size)
+        os.replace(tmp_path, dst)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quote the cheapest shipping method for every package in a manifest.")
+    parser.add_argument("manifest", help="CSV file with a header row, or a .parquet file")
+    parser.add_argument("output", help="where to write the quotes, same format as the manifest")
+    parser.add_argument("--config", help="JSON rate config, defaults to the rates in shipping_calc.py")
+    parser.add_argument("--weight-column", default="weight")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    tables = rt.load_tables(args.config) if args.config else rt.DEFAULT_TABLES
+    start = perf_counter()
+    total = quote_manifest(args.manifest, args.output, tables, args.weight_column, args.chunk_size)
+    elapsed = perf_counter() - start
+    print("Quoted {:,} packages in {:.2f}s ({:,.0f} packages/sec)".format(total, elapsed, total / elapsed),
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
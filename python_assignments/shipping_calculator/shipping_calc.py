@@ -59,4 +59,5 @@ def main():
     print("Cost of Drone Shipping: ${:.2f}".format(drone_shipping_cost(weight)))
     print("The cheapest method of shipping is {} and it will cost ${:.2f}".format(method, cost))
 
-main()
+if __name__ == "__main__":
+    main()
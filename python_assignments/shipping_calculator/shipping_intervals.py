@@ -0,0 +1,139 @@
+# Precompiled cheapest-shipping lookup.
+#
+# For a fixed set of rate tables the cheapest method only depends on the
+# weight, and it can only change at a tier breakpoint or where two methods
+# cost the same (a break-even weight). compile_rates works those weights out
+# once and builds an interval table: between two neighbouring critical
+# weights the winner and its cost line (slope * weight + intercept) never
+# change, and the critical weights themselves are stored with their own
+# winner and cost. A quote is then one binary search.
+#
+# Compiled tables are cached by the rate tables they were built from, so a
+# changed config gets recompiled automatically. compile_config_file also
+# notices when a config file is edited on disk.
+#
+# Run with: python3 shipping_intervals.py --config rates.json   (prints the interval table)
+
+import argparse
+import os
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+import rate_tables as rt
+
+# points: sorted critical weights. point_methods/point_costs: winner and cost exactly at each point.
+# interval_methods/slopes/intercepts: winner and its cost line on the open interval before each
+# point, plus one more entry for the interval after the last point
+IntervalTable = namedtuple("IntervalTable", ["points", "point_methods", "point_costs", "interval_methods",
+                                             "slopes", "intercepts", "names"])
+
+
+# Slope and intercept of a rate table's cost on the tier containing weight
+def _cost_line(table, weight):
+    tier = bisect_left(table.breakpoints, weight)
+    return table.rates[tier], table.flat_rate
+
+
+def _critical_points(tables):
+    breakpoints = sorted({float(b) for table in tables for b in table.breakpoints})
+    edges = [-np.inf] + breakpoints + [np.inf]
+    points = set(breakpoints)
+    for low, high in zip(edges, edges[1:]):
+        # Any weight strictly inside the segment is on the same tier for every table
+        probe = (low + high) / 2 if np.isfinite(low) and np.isfinite(high) else (
+            high - 1 if np.isfinite(high) else (low + 1 if np.isfinite(low) else 0.0))
+        lines = [_cost_line(table, probe) for table in tables]
+        for (a1, c1), (a2, c2) in combinations(lines, 2):
+            if a1 != a2:
+                crossing = (c2 - c1) / (a1 - a2)
+                if low < crossing < high:
+                    points.add(crossing)
+    return np.array(sorted(points))
+
+
+@lru_cache(maxsize=32)
+def compile_rates(tables=rt.DEFAULT_TABLES, names=rt.METHOD_NAMES):
+    # Builds the IntervalTable for a tuple of rate tables (cached per distinct tables)
+    points = _critical_points(tables)
+    point_methods, point_costs = rt.cheapest(points, tables) if points.size else (np.zeros(0, int), np.zeros(0))
+
+    # One weight strictly inside each open interval decides its winner
+    if points.size:
+        probes = np.concatenate([[points[0] - 1], (points[:-1] + points[1:]) / 2, [points[-1] + 1]])
+    else:
+        probes = np.array([0.0])
+    interval_methods, _ = rt.cheapest(probes, tables)
+    lines = [_cost_line(tables[m], probe) for m, probe in zip(interval_methods.tolist(), probes.tolist())]
+    slopes, intercepts = (np.array(values, dtype=float) for values in zip(*lines))
+
+    table = IntervalTable(points, point_methods, point_costs, interval_methods, slopes, intercepts, tuple(names))
+    for array in table[:-1]:
+        array.flags.writeable = False
+    return table
+
+
+# Compiles the rates in a JSON config file, recompiling whenever the file changes
+def compile_config_file(path):
+    stat = os.stat(path)
+    return _compile_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _compile_file(path, mtime_ns, size):
+    return compile_rates(rt.load_tables(path))
+
+
+# Cost on the cost lines at each weight. A flat rate (zero slope) stays flat even
+# at an infinite weight instead of turning into 0 * inf = NaN
+def _line_costs(slopes, intercepts, weights):
+    return np.where(slopes == 0, intercepts, slopes * weights + intercepts)
+
+
+# Cheapest method index and cost for every weight in an array, one binary search each.
+# Weights can be any non-negative number, including inf, but not NaN
+def quote(table, weights):
+    weights = np.atleast_1d(np.asarray(weights, dtype=float))
+    i = np.searchsorted(table.points, weights, side="left")
+    with np.errstate(invalid="ignore"):
+        line_costs = _line_costs(table.slopes[i], table.intercepts[i], weights)
+    if table.points.size:
+        j = np.minimum(i, table.points.size - 1)
+        at_point = table.points[j] == weights
+        methods = np.where(at_point, table.point_methods[j], table.interval_methods[i])
+        return methods, np.where(at_point, table.point_costs[j], line_costs)
+    return table.interval_methods[i], line_costs
+
+
+# Cheapest (method name, cost) for a single weight, like cheapest_shipping
+def quote_one(table, weight):
+    i = bisect_left(table.points, weight)
+    if i < len(table.points) and table.points[i] == weight:
+        return table.names[table.point_methods[i]], float(table.point_costs[i])
+    slope, intercept = table.slopes[i], table.intercepts[i]
+    return table.names[table.interval_methods[i]], float(intercept if slope == 0 else slope * weight + intercept)
+
+
+# Rows of (from weight, to weight, method name, cost per lb, flat cost) describing the table
+def describe(table):
+    rows = []
+    edges = [-np.inf] + table.points.tolist() + [np.inf]
+    for i, (low, high) in enumerate(zip(edges, edges[1:])):
+        rows.append((low, high, table.names[table.interval_methods[i]], table.slopes[i], table.intercepts[i]))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the cheapest shipping method by weight range.")
+    parser.add_argument("--config", help="JSON rate config, defaults to the rates in shipping_calc.py")
+    args = parser.parse_args()
+    table = compile_config_file(args.config) if args.config else compile_rates()
+    for low, high, name, slope, intercept in describe(table):
+        print("{:>10.4f} < weight < {:<10.4f} {:<24} ${:.2f}/lb + ${:.2f}".format(low, high, name, slope, intercept))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# Asyncio HTTP server for cheapest shipping quotes.
+#
+# Only needs the standard library and NumPy. Concurrent requests are
+# collected into micro-batches: the first request of a batch starts a short
+# timer, and when it fires (or the batch is full) every waiting weight is
+# priced with one vectorized shipping_intervals.quote call.
+#
+# Endpoints:
+#   GET /quote?weight=4.5   {"weight": 4.5, "method": "Ground Shipping", "cost": 33.5}
+#   GET /metrics            request count, p50/p99 quote latency in ms (from parsed request
+#                           to priced, so it includes the batching wait) and batch size stats
+#
+# Run with: python3 shipping_server.py --port 8080
+# Add --no-batching to price every request on its own with cheapest_shipping.
+
+import argparse
+import asyncio
+import json
+import math
+from collections import deque
+from time import perf_counter
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+import shipping_intervals as si
+from shipping_calc import cheapest_shipping
+
+MAX_BATCH_SIZE = 1024
+MAX_DELAY = 0.0002
+# Only the most recent requests are kept for the latency percentiles
+METRICS_WINDOW = 100_000
+
+
+class QuoteBatcher:
+    def __init__(self, table, max_batch_size=MAX_BATCH_SIZE, max_delay=MAX_DELAY):
+        self.table = table
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.weights = []
+        self.futures = []
+        self.timer = None
+        self.batch_sizes = deque(maxlen=METRICS_WINDOW)
+
+    async def quote(self, weight):
+        # Waits for the batch this weight ends up in and returns (method name, cost)
+        future = asyncio.get_running_loop().create_future()
+        self.weights.append(weight)
+        self.futures.append(future)
+        if len(self.weights) >= self.max_batch_size:
+            self.flush()
+        elif self.timer is None:
+            # With no delay the batch is everything that arrived in this event loop iteration
+            loop = asyncio.get_running_loop()
+            self.timer = loop.call_later(self.max_delay, self.flush) if self.max_delay else loop.call_soon(self.flush)
+        return await future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        weights, futures = self.weights, self.futures
+        self.weights, self.futures = [], []
+        if not weights:
+            return
+        methods, costs = si.quote(self.table, np.array(weights))
+        for future, method, cost in zip(futures, methods.tolist(), costs.tolist()):
+            if not future.done():
+                future.set_result((self.table.names[method], cost))
+        self.batch_sizes.append(len(weights))
+
+
+class QuoteServer:
+    def __init__(self, batching=True, table=None, max_batch_size=MAX_BATCH_SIZE, max_delay=MAX_DELAY):
+        self.batcher = QuoteBatcher(table or si.compile_rates(), max_batch_size, max_delay) if batching else None
+        self.latencies = deque(maxlen=METRICS_WINDOW)
+        self.requests = 0
+
+    async def quote(self, weight):
+        if self.batcher is None:
+            return cheapest_shipping(weight)
+        return await self.batcher.quote(weight)
+
+    def metrics(self):
+        latencies = np.array(self.latencies) * 1000
+        batch_sizes = np.array(self.batcher.batch_sizes if self.batcher else [])
+        return {
+            "requests": self.requests,
+            "batching": self.batcher is not None,
+            "latency_ms": {
+                "p50": float(np.percentile(latencies, 50)) if latencies.size else None,
+                "p99": float(np.percentile(latencies, 99)) if latencies.size else None,
+            },
+            "batch_size": {
+                "batches": int(batch_sizes.size),
+                "mean": float(batch_sizes.mean()) if batch_sizes.size else None,
+                "max": int(batch_sizes.max()) if batch_sizes.size else None,
+            },
+        }
+
+    async def respond(self, target):
+        # Returns (status, body) for a request target like /quote?weight=3
+        url = urlsplit(target)
+        if url.path == "/metrics":
+            return "200 OK", self.metrics()
+        if url.path != "/quote":
+            return "404 Not Found", {"error": "not found"}
+        try:
+            weight = float(parse_qs(url.query)["weight"][0])
+        except (KeyError, ValueError):
+            return "400 Bad Request", {"error": "weight query parameter must be a number"}
+        if not math.isfinite(weight):
+            return "400 Bad Request", {"error": "weight must be a finite number"}
+        if weight < 0:
+            return "400 Bad Request", {"error": "weight must not be negative"}
+        start = perf_counter()
+        method, cost = await self.quote(weight)
+        self.latencies.append(perf_counter() - start)
+        self.requests += 1
+        return "200 OK", {"weight": weight, "method": method, "cost": cost}
+
+    async def handle(self, reader, writer):
+        # One connection, any number of keep-alive requests
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    keep_alive = True
+                    while True:
+                        header = await reader.readline()
+                        if header in (b"\r\n", b"\n", b""):
+                            break
+                        if header.lower().startswith(b"connection:") and b"close" in header.lower():
+                            keep_alive = False
+                except ValueError:
+                    # readline raises ValueError for a line longer than the reader's limit (64 KiB),
+                    # the rest of the request can't be found reliably so the connection is closed
+                    request_line, keep_alive = None, False
+                if request_line is None:
+                    status, body = "431 Request Header Fields Too Large", {"error": "request line or header too long"}
+                else:
+                    parts = request_line.decode("latin-1").split()
+                    if len(parts) != 3 or parts[0] != "GET":
+                        status, body = "400 Bad Request", {"error": "only GET requests are supported"}
+                        keep_alive = False
+                    else:
+                        status, body = await self.respond(parts[1])
+                payload = json.dumps(body).encode()
+                writer.write(
+                    "HTTP/1.1 {}\r\nContent-Type: application/json\r\nContent-Length: {}\r\nConnection: {}\r\n\r\n"
+                    .format(status, len(payload), "keep-alive" if keep_alive else "close").encode() + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve cheapest shipping quotes over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--config", help="JSON rate config, defaults to the rates in shipping_calc.py")
+    parser.add_argument("--no-batching", action="store_true", help="price each request with cheapest_shipping")
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE)
+    parser.add_argument("--max-delay-ms", type=float, default=MAX_DELAY * 1000)
+    args = parser.parse_args()
+
+    table = si.compile_config_file(args.config) if args.config else si.compile_rates()
+    server = QuoteServer(not args.no_batching, table, args.max_batch_size, args.max_delay_ms / 1000)
+    print("Serving shipping quotes on http://{}:{}".format(args.host, args.port), flush=True)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
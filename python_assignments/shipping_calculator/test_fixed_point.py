@@ -0,0 +1,63 @@
+import random
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+import fixed_point as fp
+import rate_tables as rt
+
+
+def decimal_cheapest(milli):
+    # cheapest_shipping done with Decimal, returning (method index, cost in millicents)
+    weight = Decimal(milli) / 1000
+    tier = 0 if weight <= 2 else 1 if weight <= 6 else 2 if weight <= 10 else 3
+    ground = weight * Decimal(("1.5", "3", "4", "4.75")[tier]) + 20
+    drone = weight * Decimal(("4.5", "9", "12", "14.25")[tier])
+    premium = Decimal(125)
+    if ground < drone and ground < premium:
+        return 0, ground * 100000
+    if drone < ground and drone < premium:
+        return 1, drone * 100000
+    return 2, premium * 100000
+
+
+class FixedPointTests(unittest.TestCase):
+    def test_cheapest_matches_decimal(self):
+        rng = random.Random(0)
+        # Every milli-lb around the breakpoints and break-even weights, and random weights
+        milli = set(range(0, 12000)) | set(range(22000, 22200)) | {rng.randrange(10 ** 9) for _ in range(2000)}
+        milli = np.array(sorted(milli), dtype=np.int64)
+        methods, millicents = fp.cheapest(milli)
+        for weight, method, cost in zip(milli.tolist(), methods.tolist(), millicents.tolist()):
+            self.assertEqual((method, cost), decimal_cheapest(weight), weight)
+
+    def test_to_cents_rounds_half_up(self):
+        self.assertEqual(fp.to_cents([3237500, 3237499, 0, 500, -500]).tolist(), [3238, 3237, 0, 1, -1])
+
+    def test_weights_from_str(self):
+        self.assertEqual(fp.weights_from_str(["1", "1.5", "-2.25", ".001", "3.1000", "4.125"]).tolist(),
+                         [1000, 1500, -2250, 1, 3100, 4125])
+        self.assertRaises(ValueError, fp.weights_from_str, ["1.0001"])
+
+    def test_weights_from_str_edge_cases(self):
+        self.assertEqual(fp.weights_from_str(["0", "-0", "5.", "-.5", "007.250"]).tolist(), [0, 0, 5000, -500, 7250])
+        self.assertEqual(fp.weights_from_str(np.array([], dtype=str)).tolist(), [])
+
+    def test_weights_from_str_rejects_non_numbers(self):
+        for weight in ["", "-", ".", "-.", "--1", "1-", "+1", "1.2.3", "1e3", "abc", " 1", "1,5", "nan"]:
+            with self.subTest(weight=weight):
+                self.assertRaises(ValueError, fp.weights_from_str, ["1", weight])
+
+    def test_to_fixed_rejects_extra_precision(self):
+        self.assertRaises(ValueError, fp.to_fixed, rt.RateTable((2,), (1.005, 2), 0))
+
+    def test_overflow(self):
+        self.assertRaises(OverflowError, fp.cheapest, [2 ** 62])
+
+    def test_format_cents(self):
+        self.assertEqual(fp.format_cents([3350, 5, -120]), ["$33.50", "$0.05", "-$1.20"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import os
+import unittest
+
+import numpy as np
+
+import rate_tables as rt
+from shipping_calc import cheapest_shipping
+
+
+def interesting_weights():
+    # Tier breakpoints, the weights where the default methods break even and the floats
+    # right next to each, plus random weights
+    points = np.array([0.0, 2, 6, 10, 10 / 3, 105 / 4.75])
+    weights = np.concatenate([points, np.nextafter(points, -np.inf), np.nextafter(points, np.inf)])
+    rng = np.random.default_rng(0)
+    weights = np.concatenate([weights, rng.uniform(0, 40, 5000), rng.uniform(0, 1e6, 100), [1e300, np.inf]])
+    return np.unique(weights[weights >= 0])
+
+
+class RateTableTests(unittest.TestCase):
+    def test_cheapest_matches_cheapest_shipping(self):
+        weights = interesting_weights()
+        methods, costs = rt.cheapest(weights)
+        for weight, method, cost in zip(weights.tolist(), methods.tolist(), costs.tolist()):
+            self.assertEqual((rt.METHOD_NAMES[method], cost), cheapest_shipping(weight), weight)
+
+    def test_load_tables(self):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rates.json")
+        self.assertEqual(rt.load_tables(path), rt.DEFAULT_TABLES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import csv
+import os
+import tempfile
+import unittest
+
+import shipping_batch as sb
+from shipping_calc import cheapest_shipping
+
+
+class QuoteCsvTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.src = os.path.join(self.tmp.name, "manifest.csv")
+        self.dst = os.path.join(self.tmp.name, "quotes.csv")
+
+    def write_manifest(self, text):
+        with open(self.src, "w", newline="") as f:
+            f.write(text)
+
+    def read_quotes(self):
+        with open(self.dst, newline="") as f:
+            return list(csv.reader(f))
+
+    def test_quotes(self):
+        self.write_manifest("id,weight\na,4.5\nb,0\nc,30\n")
+        self.assertEqual(sb.quote_manifest(self.src, self.dst, chunk_size=2), 3)
+        rows = self.read_quotes()
+        self.assertEqual(rows[0], ["id", "weight", "method", "cost"])
+        for row in rows[1:]:
+            method, cost = cheapest_shipping(float(row[1]))
+            self.assertEqual(row[2:], [method, "%.2f" % cost])
+
+    def test_blank_lines_are_skipped(self):
+        self.write_manifest("id,weight\na,1\n\n   \n,\nb,2\n\n")
+        for chunk_size in [1, 2, 100]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(sb.quote_manifest(self.src, self.dst, chunk_size=chunk_size), 2)
+                self.assertEqual([row[0] for row in self.read_quotes()], ["id", "a", "b"])
+
+    def test_bad_rows(self):
+        for text, message in [
+            ("id,weight\na,1\nb,\n", "row 2"),
+            ("id,weight\na,1\n\nb,  \n", "row 3"),
+            ("id,weight\na,1\nb\n", "row 2"),
+            ("id,weight\na,heavy\n", "row 1"),
+            ("id,weight\na,1\nb,-2\n", "row 2"),
+            ("id,weight\na,nan\n", "row 1"),
+            ("id,weight\na,1\nb,inf\n", "row 2"),
+        ]:
+            with self.subTest(text=text):
+                self.write_manifest(text)
+                with self.assertRaisesRegex(ValueError, message):
+                    sb.quote_manifest(self.src, self.dst, chunk_size=1)
+                self.assertEqual(os.listdir(self.tmp.name), ["manifest.csv"])
+
+    def test_bad_row_keeps_old_quotes(self):
+        self.write_manifest("id,weight\na,1\n")
+        sb.quote_manifest(self.src, self.dst)
+        old = self.read_quotes()
+        self.write_manifest("id,weight\na,1\nb,x\n")
+        self.assertRaises(ValueError, sb.quote_manifest, self.src, self.dst)
+        self.assertEqual(self.read_quotes(), old)
+
+
+class QuoteParquetTests(unittest.TestCase):
+    def setUp(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        self.pa, self.pq = pa, pq
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.src = os.path.join(self.tmp.name, "manifest.parquet")
+        self.dst = os.path.join(self.tmp.name, "quotes.parquet")
+
+    def write_manifest(self, weights):
+        self.pq.write_table(self.pa.table({"weight": self.pa.array(weights, type=self.pa.float64())}), self.src)
+
+    def test_quotes(self):
+        self.write_manifest([4.5, 0, 30])
+        self.assertEqual(sb.quote_manifest(self.src, self.dst, chunk_size=2), 3)
+        table = self.pq.read_table(self.dst).to_pydict()
+        self.assertEqual(list(zip(table["method"], table["cost"])),
+                         [cheapest_shipping(weight) for weight in [4.5, 0, 30]])
+
+    def test_bad_rows(self):
+        for weights, message in [([1, None], "row 2: weight is missing"), ([1, 2, -1], "row 3"),
+                                 ([float("nan")], "row 1")]:
+            with self.subTest(weights=weights):
+                self.write_manifest(weights)
+                with self.assertRaisesRegex(ValueError, message):
+                    sb.quote_manifest(self.src, self.dst, chunk_size=2)
+                self.assertEqual(os.listdir(self.tmp.name), ["manifest.parquet"])
+
+
+if __name__ == "__main__":
+    unittest.main()
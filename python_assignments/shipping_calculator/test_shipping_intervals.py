@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+import shipping_intervals as si
+from shipping_calc import cheapest_shipping
+
+
+def interesting_weights():
+    # Tier breakpoints, break-even weights and the floats right next to each, plus random weights
+    table = si.compile_rates()
+    points = np.concatenate([[0.0, 2, 6, 10], table.points])
+    weights = np.concatenate([points, np.nextafter(points, -np.inf), np.nextafter(points, np.inf)])
+    rng = np.random.default_rng(0)
+    weights = np.concatenate([weights, rng.uniform(0, 40, 5000), rng.uniform(0, 1e6, 100), [1e300, np.inf]])
+    return np.unique(weights[weights >= 0])
+
+
+class IntervalTableTests(unittest.TestCase):
+    def setUp(self):
+        self.table = si.compile_rates()
+
+    def test_quote_matches_cheapest_shipping(self):
+        weights = interesting_weights()
+        methods, costs = si.quote(self.table, weights)
+        for weight, method, cost in zip(weights.tolist(), methods.tolist(), costs.tolist()):
+            self.assertEqual((self.table.names[method], cost), cheapest_shipping(weight), weight)
+
+    def test_quote_one_matches_cheapest_shipping(self):
+        for weight in interesting_weights().tolist():
+            self.assertEqual(si.quote_one(self.table, weight), cheapest_shipping(weight), weight)
+
+    def test_compile_is_cached(self):
+        self.assertIs(si.compile_rates(), self.table)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import asyncio
+import json
+import unittest
+
+import shipping_server as ss
+from shipping_calc import cheapest_shipping
+
+
+class QuoteServerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = await asyncio.start_server(ss.QuoteServer().handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def request(self, raw):
+        # Sends one raw request on its own connection and returns (status line, headers, body)
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(raw)
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        headers = dict(line.split(": ", 1) for line in head[1:] if line)
+        body = json.loads(await reader.readexactly(int(headers["Content-Length"])))
+        writer.close()
+        await writer.wait_closed()
+        return head[0], headers, body
+
+    async def test_quote(self):
+        status, _, body = await self.request(b"GET /quote?weight=4.5 HTTP/1.1\r\n\r\n")
+        self.assertEqual(status, "HTTP/1.1 200 OK")
+        self.assertEqual((body["method"], body["cost"]), cheapest_shipping(4.5))
+
+    async def test_bad_weight(self):
+        for weight in [b"abc", b"inf", b"-1"]:
+            with self.subTest(weight=weight):
+                status, _, _ = await self.request(b"GET /quote?weight=" + weight + b" HTTP/1.1\r\n\r\n")
+                self.assertEqual(status, "HTTP/1.1 400 Bad Request")
+
+    async def test_line_too_long(self):
+        for raw in [b"GET /quote?weight=" + b"1" * 100_000 + b" HTTP/1.1\r\n\r\n",
+                    b"GET /quote?weight=1 HTTP/1.1\r\nX-Padding: " + b"a" * 100_000 + b"\r\n\r\n"]:
+            with self.subTest(size=len(raw)):
+                status, headers, _ = await self.request(raw)
+                self.assertEqual(status, "HTTP/1.1 431 Request Header Fields Too Large")
+                self.assertEqual(headers["Connection"], "close")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import threading
+
+import surfshop
+
+NUM_SHARDS = 64
+
+class CartService:
+    '''Shopping carts keyed by customer ID that many threads can share.
+
+    ShoppingCart.add_surfboards checks the board count and then adds to it,
+    so two threads adding to the same cart can both pass the check and go
+    over 4 boards. Here every cart operation holds a lock for the cart's
+    shard, and a customer always maps to the same shard. Customers in
+    different shards never wait for each other.
+    '''
+
+    def __init__(self, num_shards=NUM_SHARDS):
+        self.shards = [({}, threading.Lock()) for _ in range(num_shards)]
+
+    def _shard(self, customer_id):
+        return self.shards[hash(customer_id) % len(self.shards)]
+
+    def _with_cart(self, customer_id, action):
+        # Runs action(cart) with the shard locked, making the cart on first use
+        carts, lock = self._shard(customer_id)
+        with lock:
+            cart = carts.get(customer_id)
+            if cart is None:
+                cart = carts[customer_id] = surfshop.ShoppingCart()
+            return action(cart)
+
+    def add_surfboards(self, customer_id, quantity=1):
+        return self._with_cart(customer_id, lambda cart: cart.add_surfboards(quantity))
+
+    def apply_locals_discount(self, customer_id):
+        self._with_cart(customer_id, lambda cart: cart.apply_locals_discount())
+
+    def set_checkout_date(self, customer_id, date):
+        self._with_cart(customer_id, lambda cart: cart.set_checkout_date(date))
+
+    def snapshot(self, customer_id):
+        '''(num_surfboards, checkout_date, rental_days, locals_discount) read under the lock.'''
+        return self._with_cart(customer_id, lambda cart: (cart.num_surfboards, cart.checkout_date,
+                                                          cart.rental_days, cart.locals_discount))
+
+    def remove_cart(self, customer_id):
+        carts, lock = self._shard(customer_id)
+        with lock:
+            carts.pop(customer_id, None)
+
+    def __len__(self):
+        total = 0
+        for carts, lock in self.shards:
+            with lock:
+                total += len(carts)
+        return total
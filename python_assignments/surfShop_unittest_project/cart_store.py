@@ -0,0 +1,171 @@
+import datetime
+
+import numpy as np
+
+import surfshop
+from surfshop import validate_checkout_dates
+
+MAX_SURFBOARDS = 4
+NO_RENTAL_DAYS = -1
+# Rounds of repeated-row additions smaller than this are finished in a plain loop
+MIN_ROUND_SIZE = 32
+
+class CartStore:
+    '''Columns of cart data, one row per cart.
+
+    Batch methods take an array of rows and return a boolean mask of the rows
+    that passed validation instead of raising for each bad cart.
+    '''
+
+    def __init__(self, size=0, clock=datetime.datetime.now):
+        # clock gives the current time for checkout date checks, swap it for a fixed time in tests
+        self.clock = clock
+        self.size = 0
+        self.num_surfboards = np.zeros(0, dtype=np.int32)
+        self.checkout_date = np.zeros(0, dtype='datetime64[us]')
+        self.rental_days = np.zeros(0, dtype=np.int32)
+        self.locals_discount = np.zeros(0, dtype=bool)
+        if size:
+            self.add_carts(size)
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self, capacity):
+        # Doubles the columns so appending one cart at a time stays cheap
+        capacity = max(capacity, 2 * len(self.num_surfboards), 16)
+        for name, fill in (('num_surfboards', 0), ('checkout_date', np.datetime64('NaT')),
+                           ('rental_days', NO_RENTAL_DAYS), ('locals_discount', False)):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def add_carts(self, count=1):
+        '''Adds count empty carts and returns their rows.'''
+        if self.size + count > len(self.num_surfboards):
+            self._grow(self.size + count)
+        rows = np.arange(self.size, self.size + count)
+        self.size += count
+        return rows
+
+    def cart(self, row):
+        '''A ShoppingCart that reads and writes this store's row.'''
+        if not 0 <= row < self.size:
+            raise IndexError('cart row out of range')
+        return CartView(self, row)
+
+    def _rows(self, rows):
+        rows = np.asarray(rows, dtype=np.intp).ravel()
+        if rows.size and (rows.min() < 0 or rows.max() >= self.size):
+            raise IndexError('cart row out of range')
+        return rows
+
+    def add_surfboards(self, rows, quantity=1):
+        '''Adds quantity boards (a number or one per row) to each row's cart.
+
+        Returns a mask of the additions that were made. Additions that would
+        take a cart over 4 boards are left out, like TooManyBoardsError.
+        A row can appear more than once, the additions are then checked in order.
+        '''
+        rows = self._rows(rows)
+        quantity = np.broadcast_to(np.asarray(quantity, dtype=np.int32), rows.shape)
+        if rows.size == 0 or np.bincount(rows).max() == 1:
+            counts = self.num_surfboards[rows] + quantity
+            ok = counts <= MAX_SURFBOARDS
+            self.num_surfboards[rows[ok]] = counts[ok]
+            return ok
+        ok = np.zeros(rows.shape, dtype=bool)
+        # Rank of every addition among the additions to the same row, in input order
+        order = np.argsort(rows, kind='stable')
+        sorted_rows = rows[order]
+        starts = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+        rank = np.empty(rows.size, dtype=np.intp)
+        rank[order] = np.arange(rows.size) - np.repeat(starts, np.diff(np.r_[starts, rows.size]))
+        # Round r is the r-th addition of every row, so no row repeats within a round
+        by_rank = np.argsort(rank, kind='stable')
+        start = 0
+        for end in np.cumsum(np.bincount(rank)).tolist():
+            if end - start < MIN_ROUND_SIZE:
+                break
+            now = by_rank[start:end]
+            counts = self.num_surfboards[rows[now]] + quantity[now]
+            fits = counts <= MAX_SURFBOARDS
+            self.num_surfboards[rows[now[fits]]] = counts[fits]
+            ok[now[fits]] = True
+            start = end
+        # The few rows left have many more additions than the rest, a round per addition
+        # would cost more than checking them one by one
+        rest = np.sort(by_rank[start:])
+        boards = {row: int(self.num_surfboards[row]) for row in set(rows[rest].tolist())}
+        added = []
+        for i, row, count in zip(rest.tolist(), rows[rest].tolist(), quantity[rest].tolist()):
+            if boards[row] + count <= MAX_SURFBOARDS:
+                boards[row] += count
+                added.append(i)
+        for row, count in boards.items():
+            self.num_surfboards[row] = count
+        ok[added] = True
+        return ok
+
+    def apply_locals_discount(self, rows):
+        self.locals_discount[self._rows(rows)] = True
+
+    def set_checkout_date(self, rows, dates, now=None):
+        '''Sets each row's checkout date to the matching date.
+
+        Returns a mask of the dates that were set. Dates that are not after
+        now are left out, like CheckoutDateError. The clock is read once per
+        batch when now is not given.
+        '''
+        rows = self._rows(rows)
+        dates = np.broadcast_to(np.asarray(dates, dtype='datetime64[us]'), rows.shape)
+        ok = validate_checkout_dates(dates, self.clock() if now is None else now)
+        self.checkout_date[rows[ok]] = dates[ok]
+        return ok
+
+
+class CartView(surfshop.ShoppingCart):
+    '''One row of a CartStore behaving like a ShoppingCart.'''
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def _now(self):
+        # The store's clock, like the batch set_checkout_date
+        return self.store.clock()
+
+    @property
+    def num_surfboards(self):
+        return int(self.store.num_surfboards[self.row])
+
+    @num_surfboards.setter
+    def num_surfboards(self, value):
+        self.store.num_surfboards[self.row] = value
+
+    @property
+    def checkout_date(self):
+        date = self.store.checkout_date[self.row]
+        return None if np.isnat(date) else date.astype(datetime.datetime)
+
+    @checkout_date.setter
+    def checkout_date(self, value):
+        self.store.checkout_date[self.row] = np.datetime64('NaT') if value is None else np.datetime64(value, 'us')
+
+    @property
+    def rental_days(self):
+        days = int(self.store.rental_days[self.row])
+        return None if days == NO_RENTAL_DAYS else days
+
+    @rental_days.setter
+    def rental_days(self, value):
+        self.store.rental_days[self.row] = NO_RENTAL_DAYS if value is None else value
+
+    @property
+    def locals_discount(self):
+        return bool(self.store.locals_discount[self.row])
+
+    @locals_discount.setter
+    def locals_discount(self, value):
+        self.store.locals_discount[self.row] = value
@@ -0,0 +1,211 @@
+'''Performance regression checks for the surf shop carts.
+
+Times the add, discount and checkout paths of ShoppingCart, CartStore and
+CartService in operations per second, and measures the memory each cart
+takes with tracemalloc. The numbers are compared with a JSON baseline and
+the run fails (exit status 1) when anything got slower or bigger than the
+tolerance allows. Timings that look slow are measured again a few times
+first, so one noisy run doesn't fail the check.
+
+    python3 perf_regression.py              compare with perf_baseline.json
+    python3 perf_regression.py --update     write the current numbers as the new baseline
+'''
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+
+import cart_service
+import cart_store
+import surfshop
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perf_baseline.json')
+TOLERANCE = 0.3
+RETRIES = 3
+NUM_CARTS = 50_000
+STORE_SIZE = 4_000_000
+
+def median_rate(run, ops, setup=None, repeat=7):
+    '''Median operations per second over a few runs of run(), which does ops operations.
+
+    When setup is given, run(setup()) is timed instead and setup itself is not, so
+    making fresh carts doesn't count towards the time of the method being checked.
+    The median is steadier than the best run, which makes a lucky baseline less likely.
+    Garbage collection is off while timing, like in timeit.
+    '''
+    times = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            args = () if setup is None else (setup(),)
+            start = perf_counter()
+            run(*args)
+            times.append(perf_counter() - start)
+            del args
+    finally:
+        if enabled:
+            gc.enable()
+    return ops / statistics.median(times)
+
+def new_carts():
+    return [surfshop.ShoppingCart() for _ in range(NUM_CARTS)]
+
+def full_cart():
+    cart = surfshop.ShoppingCart()
+    cart.add_surfboards(4)
+    return cart
+
+def cart_add(carts):
+    for cart in carts:
+        cart.add_surfboards(2)
+        cart.add_surfboards(2)
+
+def cart_add_too_many(cart):
+    for _ in range(NUM_CARTS):
+        try:
+            cart.add_surfboards()
+        except surfshop.TooManyBoardsError:
+            pass
+
+def cart_discount(carts):
+    for cart in carts:
+        cart.apply_locals_discount()
+
+def cart_checkout(carts):
+    date = datetime.datetime.now() + datetime.timedelta(days=1)
+    for cart in carts:
+        cart.set_checkout_date(date)
+
+def service_add(service):
+    for customer_id in range(NUM_CARTS):
+        service.add_surfboards(customer_id, 2)
+        service.add_surfboards(customer_id, 2)
+
+def store_runs():
+    rows = np.arange(STORE_SIZE)
+    now = datetime.datetime.now()
+    dates = np.datetime64(now, 'us') + np.arange(-STORE_SIZE // 2, STORE_SIZE // 2).astype('timedelta64[s]')
+    quantities = rows % 6
+    store = cart_store.CartStore(STORE_SIZE, clock=lambda: now)
+    def empty_store():
+        store.num_surfboards[:] = 0
+        return store
+    return {
+        'store_add': (lambda store: store.add_surfboards(rows, quantities), STORE_SIZE, empty_store),
+        'store_discount': (lambda store: store.apply_locals_discount(rows), STORE_SIZE, lambda: store),
+        'store_checkout': (lambda store: store.set_checkout_date(rows, dates), STORE_SIZE, lambda: store),
+    }
+
+def measure_speed(names=None):
+    '''ops/sec of every timed path, or only the ones in names.'''
+    runs = {
+        'cart_add': (cart_add, 2 * NUM_CARTS, new_carts),
+        'cart_add_too_many': (cart_add_too_many, NUM_CARTS, full_cart),
+        'cart_discount': (cart_discount, NUM_CARTS, new_carts),
+        'cart_checkout': (cart_checkout, NUM_CARTS, new_carts),
+        'service_add': (service_add, 2 * NUM_CARTS, cart_service.CartService),
+    }
+    runs.update(store_runs())
+    return {name: median_rate(run, ops, setup) for name, (run, ops, setup) in runs.items()
+            if names is None or name in names}
+
+def bytes_per_cart(make_carts, count=NUM_CARTS):
+    '''Traced memory still held by make_carts(count), divided by count.'''
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        carts = make_carts(count)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del carts
+    return used / count
+
+def filled_carts(count):
+    date = datetime.datetime.now() + datetime.timedelta(days=1)
+    carts = [surfshop.ShoppingCart() for _ in range(count)]
+    for cart in carts:
+        cart.add_surfboards(2)
+        cart.apply_locals_discount()
+        cart.set_checkout_date(date)
+    return carts
+
+def filled_service(count):
+    service = cart_service.CartService()
+    for customer_id in range(count):
+        service.add_surfboards(customer_id, 2)
+    return service
+
+def measure_memory():
+    return {
+        'cart': bytes_per_cart(filled_carts),
+        'store_row': bytes_per_cart(cart_store.CartStore, STORE_SIZE),
+        'service_cart': bytes_per_cart(filled_service),
+    }
+
+def measure():
+    return {'ops_per_sec': measure_speed(), 'bytes_per_cart': measure_memory()}
+
+def regressions(results, baseline, tolerance=TOLERANCE):
+    '''Messages for every number that is worse than the baseline by more than tolerance.'''
+    problems = []
+    for name, rate in results['ops_per_sec'].items():
+        expected = baseline['ops_per_sec'].get(name)
+        if expected is not None and rate < expected * (1 - tolerance):
+            problems.append(f'{name}: {rate:,.0f} ops/sec, baseline {expected:,.0f}')
+    for name, size in results['bytes_per_cart'].items():
+        expected = baseline['bytes_per_cart'].get(name)
+        if expected is not None and size > expected * (1 + tolerance):
+            problems.append(f'{name}: {size:,.1f} bytes per cart, baseline {expected:,.1f}')
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the surf shop carts for speed and memory regressions.')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--update', action='store_true', help='save this run as the baseline')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help='allowed fraction slower or bigger than the baseline')
+    parser.add_argument('--retries', type=int, default=RETRIES, help='times to re-measure anything that looks slower')
+    args = parser.parse_args()
+
+    results = measure()
+    if not args.update and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        # Timings are noisy, so anything slower than the baseline gets a few more chances
+        for _ in range(args.retries):
+            slow = [name for name, rate in results['ops_per_sec'].items()
+                    if rate < baseline['ops_per_sec'].get(name, 0) * (1 - args.tolerance)]
+            if not slow:
+                break
+            for name, rate in measure_speed(slow).items():
+                results['ops_per_sec'][name] = max(rate, results['ops_per_sec'][name])
+
+    for name, rate in results['ops_per_sec'].items():
+        print(f'{name:<20} {rate:>14,.0f} ops/sec')
+    for name, size in results['bytes_per_cart'].items():
+        print(f'{name:<20} {size:>14,.1f} bytes per cart')
+
+    if args.update or not os.path.exists(args.baseline):
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f'Saved baseline to {args.baseline}')
+        return 0
+
+    problems = regressions(results, baseline, args.tolerance)
+    for problem in problems:
+        print('REGRESSION', problem)
+    return 1 if problems else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,17 @@
 import datetime
 
+import numpy as np
+
+def validate_checkout_dates(dates, now):
+    '''Whether checkout dates are after now.
+
+    One datetime gives a bool. An array of dates gives a mask of the dates
+    that are after now, compared in one go.
+    '''
+    if isinstance(dates, datetime.datetime):
+        return dates > now
+    return np.asarray(dates, dtype='datetime64[us]') > np.datetime64(now, 'us')
+
 class TooManyBoardsError(Exception):
     def __str__(self):
         msg = 'Cart cannot have more than 4 surfboards in it!'
@@ -23,8 +35,11 @@ class ShoppingCart:
             suffix = '' if quantity == 1 else 's'
             return f'Successfully added {quantity} surfboard{suffix} to cart!'
 
+    # The time checkout dates have to be after, CartView swaps in its store's clock
+    _now = staticmethod(datetime.datetime.now)
+
     def set_checkout_date(self, date):
-        if date <= datetime.datetime.now():
+        if not validate_checkout_dates(date, self._now()):
             raise CheckoutDateError
         else:
             self.checkout_date = date
@@ -1,6 +1,13 @@
 import unittest
 import surfshop
 import datetime
+import numpy as np
+import cart_store
+import cart_service
+import perf_regression
+import random
+import sys
+import threading
 
 class SurfShopTests(unittest.TestCase):
     def setUp(self):
@@ -17,7 +24,6 @@ class SurfShopTests(unittest.TestCase):
                 self.assertEqual(message, f'Successfully added {i} surfboards to cart!')
                 self.cart = surfshop.ShoppingCart()
     
-    @unittest.skip
     def test_add_too_many_surfboards(self):
         self.assertRaises(surfshop.TooManyBoardsError, self.cart.add_surfboards, 5)
         
@@ -30,6 +36,227 @@ class SurfShopTests(unittest.TestCase):
         date = datetime.datetime.now()
         self.assertRaises(surfshop.CheckoutDateError, self.cart.set_checkout_date, date)    
 
-unittest.main()
+class CartStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.store = cart_store.CartStore(5)
+
+    def test_add_surfboards(self):
+        ok = self.store.add_surfboards([0, 1, 2], [1, 4, 5])
+        self.assertEqual(ok.tolist(), [True, True, False])
+        self.assertEqual(self.store.num_surfboards[:3].tolist(), [1, 4, 0])
+
+    def test_add_surfboards_same_cart(self):
+        ok = self.store.add_surfboards([0, 0, 0, 1], [3, 3, 1, 2])
+        self.assertEqual(ok.tolist(), [True, False, True, True])
+        self.assertEqual(self.store.num_surfboards[:2].tolist(), [4, 2])
+
+    def test_add_surfboards_one_cart_many_times(self):
+        ok = self.store.add_surfboards(np.zeros(32_000, dtype=int))
+        self.assertEqual(np.flatnonzero(ok).tolist(), [0, 1, 2, 3])
+        self.assertEqual(self.store.num_surfboards[0], 4)
+
+    def test_apply_locals_discount(self):
+        self.store.apply_locals_discount([1, 3])
+        self.assertEqual(self.store.locals_discount.tolist()[:5], [False, True, False, True, False])
+
+    def test_set_checkout_date(self):
+        future = datetime.datetime.now() + datetime.timedelta(days=1)
+        past = datetime.datetime.now() - datetime.timedelta(days=1)
+        ok = self.store.set_checkout_date([0, 1], [future, past])
+        self.assertEqual(ok.tolist(), [True, False])
+        self.assertEqual(self.store.cart(0).checkout_date, future)
+        self.assertIsNone(self.store.cart(1).checkout_date)
+
+    def test_set_checkout_date_with_clock(self):
+        now = datetime.datetime(2024, 6, 1, 12)
+        store = cart_store.CartStore(3, clock=lambda: now)
+        dates = [now - datetime.timedelta(microseconds=1), now, now + datetime.timedelta(microseconds=1)]
+        self.assertEqual(store.set_checkout_date([0, 1, 2], dates).tolist(), [False, False, True])
+        later = now + datetime.timedelta(days=1)
+        self.assertEqual(store.set_checkout_date([0, 1], dates[2], now=later).tolist(), [False, False])
+
+    def test_cart_view_uses_clock(self):
+        now = datetime.datetime(2030, 1, 1)
+        store = cart_store.CartStore(2, clock=lambda: now)
+        date = datetime.datetime(2027, 1, 1)
+        self.assertEqual(store.set_checkout_date([0], [date]).tolist(), [False])
+        self.assertRaises(surfshop.CheckoutDateError, store.cart(1).set_checkout_date, date)
+        store.cart(1).set_checkout_date(datetime.datetime(2031, 1, 1))
+        self.assertEqual(store.cart(1).checkout_date, datetime.datetime(2031, 1, 1))
+
+    def test_validate_checkout_dates(self):
+        now = datetime.datetime(2024, 6, 1)
+        dates = np.array(['2024-05-31', '2024-06-01', '2024-06-02'], dtype='datetime64[us]')
+        self.assertEqual(cart_store.validate_checkout_dates(dates, now).tolist(), [False, False, True])
+        for date, expected in zip(dates.tolist(), [False, False, True]):
+            with self.subTest(date=date):
+                self.assertIs(bool(surfshop.validate_checkout_dates(date, now)), expected)
+
+    def test_cart_view(self):
+        cart = self.store.cart(2)
+        cart.add_surfboards(3)
+        cart.apply_locals_discount()
+        self.assertEqual(self.store.num_surfboards[2], 3)
+        self.assertTrue(self.store.locals_discount[2])
+        self.assertRaises(surfshop.TooManyBoardsError, cart.add_surfboards, 2)
+        self.assertRaises(surfshop.CheckoutDateError, cart.set_checkout_date, datetime.datetime.now())
+        self.assertIsNone(cart.rental_days)
+
+    def test_add_carts(self):
+        rows = self.store.add_carts(100)
+        self.assertEqual(rows.tolist(), list(range(5, 105)))
+        self.assertEqual(len(self.store), 105)
+        self.assertEqual(self.store.add_surfboards(np.arange(105), 4).sum(), 105)
+        self.assertRaises(IndexError, self.store.add_surfboards, [105])
+
+class CartServiceStressTests(unittest.TestCase):
+    def setUp(self):
+        # Switch threads as often as possible to give races every chance to happen
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.service = cart_service.CartService()
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def hammer(self, num_threads, work):
+        start = threading.Barrier(num_threads)
+        errors = []
+        def run(i):
+            start.wait()
+            try:
+                work(i)
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def add_until_full(self, customer_id, quantity, added):
+        for _ in range(50):
+            try:
+                self.service.add_surfboards(customer_id, quantity)
+                added.append(quantity)
+            except surfshop.TooManyBoardsError:
+                pass
+
+    def test_same_cart(self):
+        added = []
+        self.hammer(32, lambda i: self.add_until_full('shared', 1 + i % 2, added))
+        self.assertLessEqual(sum(added), 4)
+        self.assertEqual(self.service.snapshot('shared')[0], sum(added))
+
+    def test_different_carts(self):
+        added = {i: [] for i in range(200)}
+        self.hammer(16, lambda i: [self.add_until_full(c, 1, added[c]) for c in range(i % 4, 200, 4)])
+        for customer_id in range(200):
+            self.assertEqual(sum(added[customer_id]), 4)
+            self.assertEqual(self.service.snapshot(customer_id)[0], 4)
+        self.assertEqual(len(self.service), 200)
+
+    def test_mixed_operations(self):
+        date = datetime.datetime.now() + datetime.timedelta(days=1)
+        def work(i):
+            for c in range(20):
+                self.service.apply_locals_discount(c)
+                self.service.set_checkout_date(c, date)
+                self.add_until_full(c, 1, [])
+        self.hammer(8, work)
+        for c in range(20):
+            self.assertEqual(self.service.snapshot(c), (4, date, None, True))
+
+class BoardLimitPropertyTests(unittest.TestCase):
+    # Random sequences of additions checked against a plain model of the rule:
+    # an addition goes through exactly when the cart stays at 4 boards or fewer
+    def random_quantities(self, rng):
+        return [rng.randint(-2, 6) for _ in range(rng.randint(0, 12))]
+
+    def test_cart_never_exceeds_limit(self):
+        rng = random.Random(0)
+        for case in range(500):
+            quantities = self.random_quantities(rng)
+            with self.subTest(case=case, quantities=quantities):
+                cart = surfshop.ShoppingCart()
+                expected = 0
+                for quantity in quantities:
+                    if expected + quantity > 4:
+                        self.assertRaises(surfshop.TooManyBoardsError, cart.add_surfboards, quantity)
+                    else:
+                        cart.add_surfboards(quantity)
+                        expected += quantity
+                    self.assertEqual(cart.num_surfboards, expected)
+                    self.assertLessEqual(cart.num_surfboards, 4)
+
+    def test_store_matches_cart(self):
+        rng = random.Random(1)
+        for case in range(200):
+            rows = [rng.randrange(5) for _ in range(rng.randint(0, 30))]
+            quantities = [rng.randint(-2, 6) for _ in rows]
+            with self.subTest(case=case):
+                store = cart_store.CartStore(5)
+                carts = [surfshop.ShoppingCart() for _ in range(5)]
+                expected = []
+                for row, quantity in zip(rows, quantities):
+                    try:
+                        carts[row].add_surfboards(quantity)
+                        expected.append(True)
+                    except surfshop.TooManyBoardsError:
+                        expected.append(False)
+                self.assertEqual(store.add_surfboards(rows, quantities).tolist(), expected)
+                self.assertEqual(store.num_surfboards[:5].tolist(), [cart.num_surfboards for cart in carts])
+
+    def test_store_matches_cart_many_repeats(self):
+        # Enough rows for the vectorized rounds, and a few rows added to far more often than the rest
+        rng = random.Random(3)
+        for case in range(20):
+            rows = [rng.randrange(3) if rng.random() < 0.3 else rng.randrange(100) for _ in range(2000)]
+            quantities = [rng.randint(-2, 3) for _ in rows]
+            with self.subTest(case=case):
+                store = cart_store.CartStore(100)
+                carts = [surfshop.ShoppingCart() for _ in range(100)]
+                expected = []
+                for row, quantity in zip(rows, quantities):
+                    try:
+                        carts[row].add_surfboards(quantity)
+                        expected.append(True)
+                    except surfshop.TooManyBoardsError:
+                        expected.append(False)
+                self.assertEqual(store.add_surfboards(rows, quantities).tolist(), expected)
+                self.assertEqual(store.num_surfboards[:100].tolist(), [cart.num_surfboards for cart in carts])
+
+    def test_service_matches_cart(self):
+        rng = random.Random(2)
+        service = cart_service.CartService(num_shards=4)
+        carts = {}
+        for _ in range(2000):
+            customer_id, quantity = rng.randrange(50), rng.randint(0, 3)
+            cart = carts.setdefault(customer_id, surfshop.ShoppingCart())
+            if cart.num_surfboards + quantity > 4:
+                self.assertRaises(surfshop.TooManyBoardsError, service.add_surfboards, customer_id, quantity)
+            else:
+                cart.add_surfboards(quantity)
+                service.add_surfboards(customer_id, quantity)
+            self.assertEqual(service.snapshot(customer_id)[0], cart.num_surfboards)
+
+class PerfRegressionTests(unittest.TestCase):
+    def setUp(self):
+        self.baseline = {'ops_per_sec': {'cart_add': 1000}, 'bytes_per_cart': {'cart': 100}}
+
+    def test_within_tolerance(self):
+        results = {'ops_per_sec': {'cart_add': 800, 'new': 1}, 'bytes_per_cart': {'cart': 120}}
+        self.assertEqual(perf_regression.regressions(results, self.baseline, 0.3), [])
+
+    def test_slower_and_bigger(self):
+        results = {'ops_per_sec': {'cart_add': 600}, 'bytes_per_cart': {'cart': 140}}
+        self.assertEqual(len(perf_regression.regressions(results, self.baseline, 0.3)), 2)
+
+    def test_bytes_per_cart(self):
+        self.assertGreater(perf_regression.bytes_per_cart(perf_regression.filled_carts, 1000), 0)
+
+if __name__ == '__main__':
+    unittest.main()
 
     